@@ -0,0 +1,10 @@
+"""
+Pytest configuration for the repository root.
+
+Puts the root on sys.path, so the tests can import the ``src`` package
+however pytest is started.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
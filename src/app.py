@@ -3,16 +3,17 @@ Enhanced PDF Viewer application controller with advanced features.
 """
 import sys
 import os
-from tkinter import messagebox
+import queue
+import threading
 
 # Add src directory to path so we can import our modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.core.pdf_handler import PDFHandler
+from src.core.pdf_handler import PDFHandler, TILE_SIZE
 from src.ui.main_window import MainWindow, Toolbar
 from src.ui.canvas import PDFCanvas
 from src.ui.status_bar import StatusBar
-from src.utils.file_handler import FileHandler
+from src.utils.file_handler import open_pdf_dialog, validate_and_stat, get_file_info
 
 
 class PDFViewerApp:
@@ -21,19 +22,18 @@ class PDFViewerApp:
     def __init__(self):
         # Initialize components
         self.pdf_handler = PDFHandler()
-        self.file_handler = FileHandler()
         
         # Create main window
         self.main_window = MainWindow("Enhanced PDF Viewer", "1000x700")
         
         # Create toolbar
-        self.toolbar = Toolbar(self.main_window.root)
+        self.toolbar = Toolbar(self.main_window.root, self.main_window.batch())
         
         # Create canvas
         self.canvas = PDFCanvas(self.main_window.root)
         
         # Create status bar
-        self.status_bar = StatusBar(self.main_window.root)
+        self.status_bar = StatusBar(self.main_window.root, self.main_window.batch())
         
         # Setup event handlers
         self._setup_event_handlers()
@@ -44,6 +44,22 @@ class PDFViewerApp:
         # Current search results
         self.search_results = []
         self.current_search_index = 0
+        self._search_cancel = None  # Stops the running whole-document search
+        
+        # Pending coalesced resize render
+        self._resize_after_id = None
+        
+        # View state of the last render, to skip redundant re-renders
+        self._last_render_key = None
+        
+        # Incremented per render request; results for older tokens are dropped
+        self._render_token = 0
+        self._pending_render = None  # Future of the page render in flight
+        
+        # View of the page shown as tiles, (page_index, zoom, rotation), or None
+        self._tiled_view = None
+        self._tiles_requested = set()
+        self._tile_update_pending = False
     
     def _setup_event_handlers(self):
         """Setup event handlers for UI components."""
@@ -55,6 +71,7 @@ class PDFViewerApp:
         # Canvas events
         self.canvas.set_size_change_callback(self._on_canvas_resize)
         self.canvas.set_page_change_callback(self._on_auto_page_change)
+        self.canvas.set_view_change_callback(self._on_view_change)
         
         # Toolbar events - Navigation
         self.toolbar.set_prev_page_callback(self._prev_page)
@@ -108,23 +125,40 @@ class PDFViewerApp:
     
     def _on_window_resize(self, width: int, height: int):
         """Handle window resize events."""
-        # Update PDF handler canvas size for fit calculations
-        canvas_size = self.canvas.get_canvas_size()
-        self.pdf_handler.set_canvas_size(canvas_size[0], canvas_size[1])
-        
-        # If in fit mode, recalculate and update display
-        if self.pdf_handler.fit_mode in ["width", "height", "page"]:
-            self._update_display()
+        # The window size includes the toolbar and status bar; the canvas
+        # reports its own new size through _on_canvas_resize
+        self._schedule_resize_render()
     
     def _on_canvas_resize(self, width: int, height: int):
         """Handle canvas resize events."""
-        # Update PDF handler canvas size
+        # Use the size delivered with the event; fall back to the canvas's
+        # recorded size for the initial zero-sized event
+        if width <= 0 or height <= 0:
+            width, height = self.canvas.get_canvas_size()
         self.pdf_handler.set_canvas_size(width, height)
+        self._schedule_resize_render()
+    
+    def _schedule_resize_render(self):
+        """Coalesce a burst of resize events into a single re-render."""
+        root = self.main_window.root
+        if self._resize_after_id:
+            root.after_cancel(self._resize_after_id)
+        self._resize_after_id = root.after(100, self._do_resize_render)
+    
+    def _do_resize_render(self):
+        """Re-render for the final window size once resizing settles."""
+        self._resize_after_id = None
         
         # If in fit mode, recalculate and update display
         if self.pdf_handler.fit_mode in ["width", "height", "page"]:
             self._update_display()
     
+    def _on_view_change(self):
+        """Render newly exposed tiles once the current scroll burst is handled."""
+        if self._tiled_view and not self._tile_update_pending:
+            self._tile_update_pending = True
+            self.main_window.root.after_idle(self._update_tiles)
+    
     def _on_auto_page_change(self, direction: str) -> bool:
         """
         Handle automatic page changes from scrolling.
@@ -158,10 +192,22 @@ class PDFViewerApp:
     
     def _open_pdf(self):
         """Handle open PDF action."""
-        file_path = self.file_handler.open_pdf_dialog()
+        from tkinter import messagebox
+        
+        file_path = open_pdf_dialog()
         if file_path:
-            if self.file_handler.is_valid_pdf(file_path):
+            file_stat = validate_and_stat(file_path)
+            if file_stat is not None:
+                # Opening blocks the event loop; show why before it starts
+                self.status_bar.set_status(f"Opening {os.path.basename(file_path)}...")
+                self.status_bar.flush()
+                
+                # Opening stops the old document's search; drop its results
+                self._cancel_document_search()
                 if self.pdf_handler.open_document(file_path):
+                    self._last_render_key = None
+                    self._render_token += 1
+                    
                     # Set initial canvas size
                     canvas_size = self.canvas.get_canvas_size()
                     self.pdf_handler.set_canvas_size(canvas_size[0], canvas_size[1])
@@ -177,17 +223,19 @@ class PDFViewerApp:
                     self.main_window.root.title(f"Enhanced PDF Viewer - {filename}")
                     
                     # Update status bar
-                    file_info = self.file_handler.get_file_info(file_path)
-                    size_text = f"{file_info.get('size_mb', 0)} MB" if file_info else ""
+                    file_info = get_file_info(file_path, file_stat)
+                    size_text = f"{file_info.get('size_mb', 0):.2f} MB" if file_info else ""
                     self.status_bar.update_document_info(filename, size_text)
                     self.status_bar.set_status("Document loaded successfully")
                 else:
+                    self.status_bar.set_status("Ready")
                     messagebox.showerror("Error", "Could not open PDF file")
             else:
                 messagebox.showerror("Error", "Invalid PDF file")
     
     def _exit_app(self):
         """Handle exit application action."""
+        self._cancel_document_search()
         self.pdf_handler.close_document()
         self.main_window.quit()
     
@@ -218,6 +266,8 @@ class PDFViewerApp:
     
     def _go_to_page(self, page_number: int):
         """Handle go to page action."""
+        from tkinter import messagebox
+        
         if self.pdf_handler.go_to_page(page_number):
             self._update_display()
             self._update_ui_state()
@@ -248,44 +298,37 @@ class PDFViewerApp:
         """Handle zoom in action."""
         self.pdf_handler.zoom_in()
         self._update_display()
-        self._update_zoom_info()
     
     def _zoom_out(self):
         """Handle zoom out action."""
         self.pdf_handler.zoom_out()
         self._update_display()
-        self._update_zoom_info()
     
     def _reset_zoom(self):
         """Handle reset zoom action."""
         self.pdf_handler.reset_zoom()
         self._update_display()
-        self._update_zoom_info()
     
     # Fit methods
     def _fit_width(self):
         """Handle fit width action."""
         self.pdf_handler.set_fit_mode("width")
         self._update_display()
-        self._update_zoom_info()
     
     def _fit_height(self):
         """Handle fit height action."""
         self.pdf_handler.set_fit_mode("height")
         self._update_display()
-        self._update_zoom_info()
     
     def _fit_page(self):
         """Handle fit page action."""
         self.pdf_handler.set_fit_mode("page")
         self._update_display()
-        self._update_zoom_info()
     
     def _actual_size(self):
         """Handle actual size action."""
         self.pdf_handler.set_fit_mode("actual")
         self._update_display()
-        self._update_zoom_info()
     
     # Other methods
     def _rotate_page(self):
@@ -295,6 +338,10 @@ class PDFViewerApp:
     
     def _search_text(self, text: str):
         """Handle search text action."""
+        from tkinter import messagebox
+        
+        # A new query supersedes the previous document search, hit or miss
+        self._cancel_document_search()
         self.search_results = self.pdf_handler.search_text(text)
         self.current_search_index = 0
         
@@ -303,7 +350,55 @@ class PDFViewerApp:
             messagebox.showinfo("Search", f"Found {len(self.search_results)} instances of '{text}'")
         else:
             self.canvas.highlight_search_results([])  # Clear highlights
-            messagebox.showinfo("Search", f"'{text}' not found on current page")
+            self._start_document_search(text)
+    
+    def _start_document_search(self, text: str):
+        """Look for text on the other pages without blocking the UI."""
+        self._cancel_document_search()
+        self._search_cancel = threading.Event()
+        
+        results_queue = self.pdf_handler.submit_search_document(text, cancel=self._search_cancel)
+        self.status_bar.set_status(f"Searching document for '{text}'...")
+        self._poll_document_search(text, results_queue, self._search_cancel, [])
+    
+    def _cancel_document_search(self):
+        """Stop the running document search and discard its results."""
+        if self._search_cancel:
+            self._search_cancel.set()
+            self._search_cancel = None
+    
+    def _poll_document_search(self, text: str, results_queue: queue.Queue,
+                              cancel: threading.Event, pages: list):
+        """Collect streamed document search results on the Tk thread."""
+        if cancel.is_set():
+            return  # Superseded by a newer search
+        
+        try:
+            while True:
+                page_results = results_queue.get_nowait()
+                if page_results is None:
+                    self._finish_document_search(text, pages)
+                    return
+                pages.append(page_results[0]['page'])
+                self.status_bar.set_status(f"'{text}' found on {len(pages)} page(s) so far...")
+        except queue.Empty:
+            pass
+        
+        self.main_window.root.after(50, self._poll_document_search, text, results_queue, cancel, pages)
+    
+    def _finish_document_search(self, text: str, pages: list):
+        """Report where a text not on the current page was found."""
+        from tkinter import messagebox
+        
+        message = f"'{text}' not found on current page"
+        if pages:
+            listed = ", ".join(str(page) for page in pages[:10])
+            if len(pages) > 10:
+                listed += ", ..."
+            message += f"\nFound on page(s): {listed}"
+        
+        self.status_bar.set_status("Ready")
+        messagebox.showinfo("Search", message)
     
     def _focus_search(self):
         """Focus on search entry field."""
@@ -323,19 +418,146 @@ class PDFViewerApp:
     
     def _update_display(self, from_auto_scroll: bool = False):
         """Update the PDF display."""
-        image = self.pdf_handler.render_current_page()
-        if image:
-            # Center the image for better viewing
-            center = self.pdf_handler.fit_mode in ["width", "height", "page"]
-            self.canvas.display_image(image, center=center, from_scroll=from_auto_scroll)
+        handler = self.pdf_handler
+        if not handler.get_page_count():
+            return
+        zoom = handler.resolve_zoom()
+        
+        # Several event paths can ask for the same view twice in a row
+        # (e.g. window and canvas resize); skip the re-render if nothing changed
+        render_key = (
+            handler.current_page,
+            round(zoom, 3),
+            handler.rotation,
+            *self.canvas.get_canvas_size(),
+            handler.fit_mode
+        )
+        if render_key == self._last_render_key and not from_auto_scroll:
+            return
+        
+        # Show the zoom of the new view even if its render fails
+        self._update_zoom_info()
+        
+        # Pages much larger than the canvas only get their visible part rendered
+        center = handler.fit_mode in ["width", "height", "page"]
+        if handler.is_tiled(handler.current_page, zoom, handler.rotation):
+            self._last_render_key = render_key
+            self._render_token += 1
+            self._tiled_view = (handler.current_page, zoom, handler.rotation)
+            self._tiles_requested.clear()
+            width, height = handler.get_render_size(*self._tiled_view)
+            self.canvas.begin_tiled_page(width, height, center=center,
+                                         from_scroll=from_auto_scroll)
+            self._update_tiles()
+            return
+        
+        # Rasterize on a worker thread so the event loop stays responsive;
+        # a render for a view the user has already left is not started at all
+        if self._pending_render is not None:
+            self._pending_render.cancel()
+        future = handler.submit_render(handler.current_page, zoom, handler.rotation)
+        self._pending_render = future
+        if future is None:
+            return
+        
+        self._last_render_key = render_key
+        self._render_token += 1
+        self._tiled_view = None
+        
+        # Rescale an earlier render of this page as a stand-in until the
+        # real one arrives (e.g. while zooming)
+        if not future.done():
+            preview = handler.render_preview(handler.current_page, zoom, handler.rotation)
+            if preview:
+                self.canvas.display_page(preview, center=center)
+        
+        self._await_render(future, self._render_token,
+                           lambda data: self._show_page(data, from_auto_scroll),
+                           self._forget_render_key)
+    
+    def _update_tiles(self):
+        """Request the tiles covering the visible area of a tiled page."""
+        self._tile_update_pending = False
+        if not self._tiled_view:
+            return
+        
+        page_index, zoom, rotation = self._tiled_view
+        viewport = self.canvas.get_page_viewport()
+        tiles = self.pdf_handler.visible_tiles(page_index, zoom, rotation, viewport)
+        
+        # Drop tiles that scrolled well out of view
+        self.canvas.prune_tiles(tiles)
+        self._tiles_requested.intersection_update(tiles)
+        
+        for col, row in tiles:
+            if (col, row) in self._tiles_requested:
+                continue
+            future = self.pdf_handler.submit_tile(page_index, zoom, rotation, col, row)
+            if future is None:
+                continue
+            self._tiles_requested.add((col, row))
+            x, y = col * TILE_SIZE, row * TILE_SIZE
+            self._await_render(
+                future, self._render_token,
+                lambda data, col=col, row=row, x=x, y=y: self._show_tile(col, row, x, y, data),
+                # Let the next tile update ask for it again
+                lambda col=col, row=row: self._tiles_requested.discard((col, row))
+            )
+    
+    def _show_tile(self, col: int, row: int, x: int, y: int, data: bytes):
+        """Display a rendered tile if it is still wanted."""
+        if (col, row) in self._tiles_requested:
+            self.canvas.show_tile(col, row, x, y, data)
+    
+    def _await_render(self, future, token: int, on_result, on_failure):
+        """
+        Poll a render future from the Tk loop and pass its result on.
+        
+        on_failure is called instead when the render failed or was
+        cancelled, so the caller can have it requested again.
+        """
+        if token != self._render_token:
+            return  # Superseded by a newer render request
+        
+        if not future.done():
+            self.main_window.root.after(10, self._await_render, future, token,
+                                        on_result, on_failure)
+            return
+        
+        try:
+            data = None if future.cancelled() else future.result()
+        except Exception as e:
+            # e.g. the file was moved or deleted while open
+            print(f"Error rendering page: {e}")
+            self.status_bar.set_status(f"Error rendering page: {e}")
+            data = None
+        if not data:
+            on_failure()
+            return
+        
+        on_result(data)
+    
+    def _forget_render_key(self):
+        """Have the next display update render the current view again."""
+        self._last_render_key = None
+    
+    def _show_page(self, data: bytes, from_auto_scroll: bool):
+        """Display a rendered page and prefetch its neighbours."""
+        # Center the image for better viewing
+        center = self.pdf_handler.fit_mode in ["width", "height", "page"]
+        self.canvas.display_page(data, center=center, from_scroll=from_auto_scroll)
+        
+        # Render the neighbouring pages in the background while the user reads
+        rotation = self.pdf_handler.rotation
+        for page_index in (self.pdf_handler.current_page + 1,
+                           self.pdf_handler.current_page - 1):
+            zoom = self.pdf_handler.get_render_zoom(page_index)
+            self.pdf_handler.prefetch(page_index, zoom, rotation)
     
     def _update_ui_state(self):
         """Update UI state based on current document state."""
-        # Update page info
         current_page = self.pdf_handler.get_current_page_number()
         total_pages = self.pdf_handler.get_page_count()
-        self.toolbar.update_page_info(current_page, total_pages)
-        self.status_bar.update_page_info(current_page, total_pages)
         
         # Update navigation button states
         can_prev = self.pdf_handler.can_go_previous()
@@ -343,14 +565,20 @@ class PDFViewerApp:
         can_first = current_page > 1
         can_last = current_page < total_pages
         
-        self.toolbar.set_navigation_state(can_prev, can_next, can_first, can_last)
+        with self.main_window.batch():
+            # Update page info
+            self.toolbar.update_page_info(current_page, total_pages)
+            self.status_bar.update_page_info(current_page, total_pages)
+            
+            self.toolbar.set_navigation_state(can_prev, can_next, can_first, can_last)
     
     def _update_zoom_info(self):
         """Update zoom information display."""
         zoom_text = self.pdf_handler.get_zoom_percentage()
-        self.toolbar.update_zoom_info(zoom_text)
-        self.status_bar.update_zoom_info(zoom_text)
-        self.status_bar.update_view_mode(self.pdf_handler.fit_mode)
+        with self.main_window.batch():
+            self.toolbar.update_zoom_info(zoom_text)
+            self.status_bar.update_zoom_info(zoom_text)
+            self.status_bar.update_view_mode(self.pdf_handler.fit_mode)
     
     def run(self):
         """Start the application."""
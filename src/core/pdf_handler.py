@@ -1,23 +1,191 @@
 """
 PDF handling functionality for the PDF viewer application.
 """
-import fitz  # PyMuPDF
-from PIL import Image, ImageTk
-from typing import Optional, Tuple, List
+from typing import TYPE_CHECKING, Optional, Tuple, List
+from collections import OrderedDict
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from functools import lru_cache
 import math
+import multiprocessing
+import os
+import queue
+import re
+import threading
+
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF
+
+
+# Below this many unindexed pages, worker start-up costs more than it saves
+_PARALLEL_INDEX_MIN_PAGES = 50
+
+# Edge length in pixels of the square tiles large pages are rendered in
+TILE_SIZE = 512
+
+# Pages rendering to more than this many canvas areas are rendered as tiles
+_TILED_MIN_CANVAS_AREAS = 4
+
+
+def to_ppm(samples, width: int, height: int) -> bytes:
+    """
+    Encode packed RGB samples as binary PPM (P6) data for tk.PhotoImage.
+    
+    The body is appended in a single buffer-protocol concatenation, which
+    runs in C and copies the pixels exactly once.
+    
+    Args:
+        samples: Bytes-like object (bytes or memoryview) of width*height*3 bytes
+        width (int): Image width in pixels
+        height (int): Image height in pixels
+        
+    Returns:
+        bytes: PPM image data
+    """
+    return b"P6\n%d %d\n255\n" % (width, height) + samples
+
+
+def _parse_ppm(data: bytes) -> Tuple[memoryview, int, int]:
+    """
+    Split PPM data produced by to_ppm() into its pixel samples and size.
+    
+    The samples are returned as a view into data, without copying.
+    """
+    dims_end = data.index(b"\n", 3)
+    width, height = map(int, data[3:dims_end].split())
+    # Skip the "\n255\n" that follows the dimensions
+    return memoryview(data)[dims_end + 5:], width, height
+
+
+def _extract_text(page: "fitz.Page") -> str:
+    """Extract the whitespace-normalized search text of a page."""
+    import fitz
+    
+    # Same extraction flags as the default search_for() call
+    raw = page.get_text("text", flags=fitz.TEXT_DEHYPHENATE)
+    return " ".join(raw.split())
+
+
+def _extract_page_texts(file_path: str, page_indices: List[int]) -> List[Tuple[int, str]]:
+    """
+    Extract the text of several pages in a worker process.
+    
+    Each worker opens its own handle on the file, so pages are parsed in
+    parallel rather than serialized on one document.
+    """
+    import fitz
+    
+    with fitz.open(file_path) as document:
+        return [(i, _extract_text(document.load_page(i))) for i in page_indices]
+
+
+@lru_cache(maxsize=32)
+def _render_matrix(zoom: float, rotation: int) -> "fitz.Matrix":
+    """
+    Get the page-to-pixel transform for a zoom factor and rotation.
+    
+    Memoized so renders, tiles and size queries at an unchanged view share
+    one matrix. Callers must not modify the returned matrix.
+    """
+    import fitz
+    
+    # Rotate, then zoom; prerotate(0) leaves the matrix unchanged
+    return fitz.Matrix(zoom, zoom).prerotate(rotation)
+
+
+def _render_display_list(display_list: "fitz.DisplayList", matrix: "fitz.Matrix",
+                         pix: "fitz.Pixmap") -> bytes:
+    """
+    Replay a display list into a pixmap and encode the result as PPM bytes.
+    
+    pix determines which part of the transformed page is drawn: its own
+    bounds are the clip, so a page-sized pixmap gets the whole page and a
+    tile-sized one just that tile.
+    """
+    import fitz
+    
+    pix.clear_with(255)
+    device = fitz.Device(pix, None)
+    # The clip is in device space, i.e. after the matrix is applied
+    display_list.run(device, matrix, fitz.Rect(pix.irect))
+    device = None
+    
+    # Build the PPM straight from a zero-copy view of MuPDF's samples
+    # (pix.samples would first copy the raster into a bytes object)
+    samples = getattr(pix, "samples_mv", None) or pix.samples
+    return to_ppm(samples, pix.width, pix.height)
+
+
+@lru_cache(maxsize=32)
+def _compile_query(text: str) -> "re.Pattern":
+    """Compile a search query into a whitespace-normalized, case-insensitive pattern."""
+    return re.compile(re.escape(" ".join(text.split())), re.IGNORECASE)
+
+
+def _trigrams(text: str) -> frozenset:
+    """Get the set of lowercase character trigrams of a whitespace-normalized string."""
+    text = text.lower()
+    return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+
+@lru_cache(maxsize=32)
+def _query_trigrams(text: str) -> frozenset:
+    """Get the trigrams every page matching a search query must contain."""
+    return _trigrams(" ".join(text.split()))
 
 
 class PDFHandler:
     """Handles PDF document operations and rendering."""
     
     def __init__(self):
-        self.document: Optional[fitz.Document] = None
+        self.document: Optional["fitz.Document"] = None
+        self._page_count: int = 0
         self.current_page: int = 0
         self.zoom_factor: float = 1.0
         self.rotation: int = 0  # 0, 90, 180, 270 degrees
-        self.fit_mode: str = "width"  # "width", "height", "page", "actual"
+        self.fit_mode: str = "width"  # "width", "height", "page", "actual", "custom"
         self.canvas_size: Tuple[int, int] = (800, 600)
         self.page_margins: int = 20
+        self.render_annotations: bool = True
+        
+        # Rendered page cache: (page_index, zoom, rotation) -> PPM bytes
+        self._page_cache: OrderedDict = OrderedDict()
+        self._cache_max: int = 20
+        
+        # Recorded drawing commands, shared by the workers:
+        # (page_index, render_annotations) -> fitz.DisplayList
+        self._dl_cache: OrderedDict = OrderedDict()
+        self._dl_max: int = 8
+        
+        # Page rectangles, filled in as pages are first measured
+        self._page_rects: List[Optional["fitz.Rect"]] = []
+        
+        # Loaded page objects: page_index -> fitz.Page
+        self._page_obj_cache: OrderedDict = OrderedDict()
+        self._page_obj_max: int = 8
+        
+        # Rendered tiles of large pages: (page_index, zoom, rotation, col, row) -> PPM bytes
+        self._tile_cache: OrderedDict = OrderedDict()
+        self._tile_max: int = 48
+        
+        # Extracted page text, whitespace-normalized: page_index -> str
+        self._text_cache: dict = {}
+        self._trigram_cache: dict = {}  # page_index -> frozenset
+        self._path: Optional[str] = None
+        
+        # MuPDF documents are not thread-safe; guards the document and the cache
+        self._render_lock = threading.Lock()
+        
+        # Background rendering and prefetching, one worker per core
+        self._worker_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        self._worker_futures: List[Future] = []
+        self._workers_cancelled = threading.Event()  # Set while close waits on workers
+        
+        # Per-thread document handles, so worker threads render without
+        # holding _render_lock; tracked so they can all be closed together
+        self._tls = threading.local()
+        self._worker_docs: List["fitz.Document"] = []
+        self._worker_docs_lock = threading.Lock()
     
     def open_document(self, file_path: str) -> bool:
         """
@@ -29,8 +197,23 @@ class PDFHandler:
         Returns:
             bool: True if successful, False otherwise
         """
+        # PyMuPDF loads a large shared library; defer it until first use
+        import fitz
+        
         try:
-            self.document = fitz.open(file_path)
+            document = fitz.open(file_path)
+            self._cancel_workers()
+            self._close_worker_docs()
+            with self._render_lock:
+                self.document = document
+                self._page_count = len(document)
+                self._page_rects = [None] * self._page_count
+                self._path = file_path
+                self._page_cache.clear()
+                self._tile_cache.clear()
+                self._page_obj_cache.clear()
+                self._text_cache.clear()
+                self._trigram_cache.clear()
             self.current_page = 0
             self.zoom_factor = 1.0
             self.rotation = 0
@@ -42,20 +225,115 @@ class PDFHandler:
     
     def close_document(self):
         """Close the current document."""
-        if self.document:
-            self.document.close()
-            self.document = None
-            self.current_page = 0
-            self.zoom_factor = 1.0
-            self.rotation = 0
+        self._cancel_workers()
+        self._close_worker_docs()
+        
+        with self._render_lock:
+            self._page_obj_cache.clear()
+            self._text_cache.clear()
+            self._trigram_cache.clear()
+            if self.document:
+                self.document.close()
+                self.document = None
+                self._page_count = 0
+                self._page_rects = []
+                self._path = None
+                self.current_page = 0
+                self.zoom_factor = 1.0
+                self.rotation = 0
+            self._page_cache.clear()
+            self._tile_cache.clear()
+    
+    def _cancel_workers(self):
+        """Cancel queued background work and wait for running jobs to finish."""
+        self._workers_cancelled.set()
+        for future in self._worker_futures:
+            future.cancel()
+        wait(self._worker_futures)
+        self._worker_futures.clear()
+        self._workers_cancelled.clear()
+    
+    def _submit(self, fn, *args) -> Future:
+        """Run a job on the worker pool, tracking it so close can wait for it."""
+        self._worker_futures = [f for f in self._worker_futures if not f.done()]
+        future = self._worker_pool.submit(fn, *args)
+        self._worker_futures.append(future)
+        return future
+    
+    def _doc(self) -> Optional["fitz.Document"]:
+        """
+        Get the calling thread's own handle on the open document.
+        
+        A handle is opened from the document path on first use in each
+        thread. Worker threads use it instead of ``self.document``, which
+        stays with the Tk thread.
+        
+        Since the file is reopened, this raises if it was moved or deleted
+        after open_document(); the render futures carry that error back to
+        the Tk thread.
+        """
+        path = self._path
+        if not path:
+            return None
+        
+        document = getattr(self._tls, "doc", None)
+        if document is None or document.is_closed or self._tls.path != path:
+            import fitz
+            
+            document = fitz.open(path)
+            with self._worker_docs_lock:
+                self._worker_docs.append(document)
+            self._tls.doc = document
+            self._tls.path = path
+        return document
+    
+    def _close_worker_docs(self):
+        """Close every per-thread document handle."""
+        # The shared display lists were recorded on these handles
+        with self._render_lock:
+            self._dl_cache.clear()
+        with self._worker_docs_lock:
+            documents, self._worker_docs = self._worker_docs, []
+        for document in documents:
+            document.close()
     
     def set_canvas_size(self, width: int, height: int):
         """Set the canvas size for fit calculations."""
         self.canvas_size = (width, height)
     
+    def _get_page(self, page_index: int) -> "fitz.Page":
+        """
+        Get a loaded page, reusing recently loaded page objects.
+        
+        Callers must hold ``_render_lock``.
+        """
+        page = self._page_obj_cache.get(page_index)
+        if page is None:
+            page = self.document.load_page(page_index)
+            self._page_obj_cache[page_index] = page
+            while len(self._page_obj_cache) > self._page_obj_max:
+                self._page_obj_cache.popitem(last=False)
+        else:
+            self._page_obj_cache.move_to_end(page_index)
+        return page
+    
+    def _page_rect(self, page_index: int) -> "fitz.Rect":
+        """
+        Get the rectangle of a page, loading the page only the first time.
+        
+        Fit zoom, page size and tiling queries run on every resize and
+        navigation; after the first lookup they no longer touch MuPDF.
+        """
+        rect = self._page_rects[page_index]
+        if rect is None:
+            with self._render_lock:
+                rect = self._get_page(page_index).rect
+            self._page_rects[page_index] = rect
+        return rect
+    
     def get_page_count(self) -> int:
         """Get total number of pages in the document."""
-        return len(self.document) if self.document else 0
+        return self._page_count
     
     def get_current_page_number(self) -> int:
         """Get current page number (1-indexed)."""
@@ -63,19 +341,18 @@ class PDFHandler:
     
     def go_to_page(self, page_number: int) -> bool:
         """Go to specific page (1-indexed)."""
-        if self.document and 1 <= page_number <= len(self.document):
+        if 1 <= page_number <= self._page_count:
             self.current_page = page_number - 1
             return True
         return False
     
     def can_go_previous(self) -> bool:
         """Check if we can go to previous page."""
-        return self.document is not None and self.current_page > 0
+        return self.current_page > 0 and self._page_count > 0
     
     def can_go_next(self) -> bool:
         """Check if we can go to next page."""
-        return (self.document is not None and 
-                self.current_page < len(self.document) - 1)
+        return self.current_page + 1 < self._page_count
     
     def go_to_previous_page(self) -> bool:
         """Go to previous page."""
@@ -93,32 +370,36 @@ class PDFHandler:
     
     def go_to_first_page(self) -> bool:
         """Go to first page."""
-        if self.document and len(self.document) > 0:
+        if self._page_count > 0:
             self.current_page = 0
             return True
         return False
     
     def go_to_last_page(self) -> bool:
         """Go to last page."""
-        if self.document and len(self.document) > 0:
-            self.current_page = len(self.document) - 1
+        if self._page_count > 0:
+            self.current_page = self._page_count - 1
             return True
         return False
     
     def set_zoom_factor(self, zoom_factor: float):
         """Set zoom factor."""
+        self.fit_mode = "custom"
         self.zoom_factor = max(0.1, min(5.0, zoom_factor))  # Min 0.1, Max 5.0
     
     def zoom_in(self, factor: float = 1.2):
         """Zoom in by the specified factor."""
+        self.fit_mode = "custom"
         self.zoom_factor = min(5.0, self.zoom_factor * factor)
     
     def zoom_out(self, factor: float = 1.2):
         """Zoom out by the specified factor."""
+        self.fit_mode = "custom"
         self.zoom_factor = max(0.1, self.zoom_factor / factor)
     
     def reset_zoom(self):
         """Reset zoom to 100%."""
+        self.fit_mode = "custom"
         self.zoom_factor = 1.0
     
     def set_fit_mode(self, mode: str):
@@ -127,14 +408,56 @@ class PDFHandler:
             self.fit_mode = mode
             self._calculate_fit_zoom()
     
+    def get_render_zoom(self, page_index: int) -> float:
+        """
+        Get the zoom factor a page will be rendered at.
+        
+        In the fit modes this is resolved against the canvas size for that
+        particular page, so pages of different sizes each fit the window.
+        
+        Args:
+            page_index (int): Page index (0-indexed)
+            
+        Returns:
+            float: Zoom factor
+        """
+        zoom = self._fit_zoom(page_index)
+        return self.zoom_factor if zoom is None else zoom
+    
+    def resolve_zoom(self) -> float:
+        """
+        Resolve the fit zoom of the current page into zoom_factor.
+        
+        Called on the Tk thread before rendering, so the zoom shown and the
+        zoom a fit-mode view is later zoomed in or out from match the
+        pixels actually rendered.
+        
+        Returns:
+            float: Zoom factor the current page renders at
+        """
+        self._calculate_fit_zoom()
+        return self.zoom_factor
+    
     def _calculate_fit_zoom(self):
         """Calculate zoom factor based on fit mode."""
-        if not self.document or not (0 <= self.current_page < len(self.document)):
+        if not self.document or not (0 <= self.current_page < self._page_count):
             return
         
+        zoom = self._fit_zoom(self.current_page)
+        if zoom is not None:
+            self.zoom_factor = zoom
+    
+    def _fit_zoom(self, page_index: int) -> Optional[float]:
+        """Zoom factor for a page in the current fit mode, or None for custom zoom."""
+        if self.fit_mode == "actual":
+            return 1.0
+        if self.fit_mode not in ("width", "height", "page"):
+            return None
+        if not self.document or not (0 <= page_index < self._page_count):
+            return None
+        
         try:
-            page = self.document.load_page(self.current_page)
-            page_rect = page.rect
+            page_rect = self._page_rect(page_index)
             
             # Apply rotation
             if self.rotation == 90 or self.rotation == 270:
@@ -146,20 +469,27 @@ class PDFHandler:
             canvas_height = self.canvas_size[1] - 2 * self.page_margins
             
             if self.fit_mode == "width":
-                self.zoom_factor = canvas_width / page_width
+                zoom = canvas_width / page_width
             elif self.fit_mode == "height":
-                self.zoom_factor = canvas_height / page_height
-            elif self.fit_mode == "page":
+                zoom = canvas_height / page_height
+            else:
                 width_scale = canvas_width / page_width
                 height_scale = canvas_height / page_height
-                self.zoom_factor = min(width_scale, height_scale)
-            elif self.fit_mode == "actual":
-                self.zoom_factor = 1.0
+                zoom = min(width_scale, height_scale)
             
             # Ensure zoom is within bounds
-            self.zoom_factor = max(0.1, min(5.0, self.zoom_factor))
+            return max(0.1, min(5.0, zoom))
         except Exception:
-            self.zoom_factor = 1.0
+            return 1.0
+    
+    def set_render_annotations(self, enabled: bool):
+        """Enable or disable rendering of PDF annotations."""
+        if enabled != self.render_annotations:
+            with self._render_lock:
+                self.render_annotations = enabled
+                self._page_cache.clear()
+                self._tile_cache.clear()
+                self._dl_cache.clear()
     
     def rotate_page(self, degrees: int = 90):
         """Rotate page by degrees (90, 180, 270)."""
@@ -169,42 +499,322 @@ class PDFHandler:
         """Reset page rotation."""
         self.rotation = 0
     
-    def render_current_page(self) -> Optional[ImageTk.PhotoImage]:
+    def submit_render(self, page_index: int, zoom: float, rotation: int) -> Optional[Future]:
         """
-        Render the current page as an ImageTk.PhotoImage.
+        Render a page as PPM image data on a worker thread.
         
+        Cached pages resolve immediately. The returned future must be
+        consumed on the Tk thread, which builds the PhotoImage.
+        
+        Args:
+            page_index (int): Page to render (0-indexed)
+            zoom (float): Zoom factor to render at
+            rotation (int): Rotation in degrees
+            
         Returns:
-            ImageTk.PhotoImage or None if no document is loaded
+            Future resolving to bytes, or None if the page does not exist
         """
-        if not self.document or not (0 <= self.current_page < len(self.document)):
+        if not self.document or not (0 <= page_index < self._page_count):
             return None
         
-        try:
-            # Get the page
-            page = self.document.load_page(self.current_page)
+        key = (page_index, round(zoom, 3), rotation)
+        with self._render_lock:
+            data = self._page_cache.get(key)
+            if data is not None:
+                self._page_cache.move_to_end(key)
+        if data is not None:
+            future = Future()
+            future.set_result(data)
+            return future
+        
+        return self._submit(self._render_cached, page_index, zoom, rotation)
+    
+    def render_preview(self, page_index: int, zoom: float, rotation: int) -> Optional[bytes]:
+        """
+        Build a quick placeholder for a page by rescaling a cached render.
+        
+        The most recently used render of the page at the same rotation is
+        resized with Pillow, which is far cheaper than rasterizing, so it
+        can be shown while the real render runs.
+        
+        Args:
+            page_index (int): Page index (0-indexed)
+            zoom (float): Zoom factor the placeholder should appear at
+            rotation (int): Rotation in degrees
             
-            # Apply rotation
-            if self.rotation != 0:
-                rotation_matrix = fitz.Matrix(1, 0, 0, 1, 0, 0)
-                rotation_matrix = rotation_matrix.prerotate(self.rotation)
+        Returns:
+            bytes: PPM image data, or None if nothing suitable is cached
+        """
+        try:
+            from PIL import Image
+        except ImportError:
+            return None
+        
+        with self._render_lock:
+            for (cached_page, cached_zoom, cached_rotation), data in reversed(self._page_cache.items()):
+                if cached_page == page_index and cached_rotation == rotation:
+                    break
             else:
-                rotation_matrix = fitz.Matrix(1, 0, 0, 1, 0, 0)
-            
-            # Apply zoom
-            zoom_matrix = fitz.Matrix(self.zoom_factor, self.zoom_factor)
-            final_matrix = rotation_matrix * zoom_matrix
+                return None
+        
+        try:
+            # Wrap the cached samples directly instead of decoding a copy
+            samples, width, height = _parse_ppm(data)
+            image = Image.frombuffer("RGB", (width, height), samples, "raw", "RGB", 0, 1)
+            scale = zoom / cached_zoom
+            size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+            image = image.resize(size, Image.BILINEAR)
+            return to_ppm(image.tobytes(), image.width, image.height)
+        except Exception as e:
+            print(f"Error building preview: {e}")
+            return None
+    
+    def prefetch(self, page_index: int, zoom: float, rotation: int):
+        """
+        Render a page into the cache on the background thread.
+        
+        Only the PPM bytes are produced off-thread; the PhotoImage is built
+        on the Tk thread when the page is actually displayed.
+        
+        Args:
+            page_index (int): Page to render (0-indexed)
+            zoom (float): Zoom factor to render at
+            rotation (int): Rotation in degrees
+        """
+        if not self.document or not (0 <= page_index < self._page_count):
+            return
+        
+        self._submit(self._prefetch_page, page_index, zoom, rotation)
+    
+    def _prefetch_page(self, page_index: int, zoom: float, rotation: int):
+        """
+        Worker-thread body for prefetch().
+        
+        Text extraction runs on the thread's own document handle;
+        _render_lock is only taken to check and fill the caches, so the Tk
+        thread can keep rendering and searching meanwhile.
+        """
+        try:
+            self._render_cached(page_index, zoom, rotation)
             
-            # Render page
-            pix = page.get_pixmap(matrix=final_matrix, alpha=False)
+            with self._render_lock:
+                path = self._path
+                if not path or page_index in self._text_cache:
+                    return
+            document = self._doc()
+            if document is None:
+                return
+            text = _extract_text(document.load_page(page_index))
+            with self._render_lock:
+                if self._path == path and page_index not in self._text_cache:
+                    self._store_page_text(page_index, text)
+        except Exception as e:
+            print(f"Error prefetching page: {e}")
+    
+    def _render_cached(self, page_index: int, zoom: float, rotation: int) -> Optional[bytes]:
+        """
+        Worker-thread body: get a page as PPM bytes, rendering it into the cache.
+        
+        The render itself runs on the thread's own document handle, outside
+        _render_lock.
+        """
+        key = (page_index, round(zoom, 3), rotation)
+        with self._render_lock:
+            path = self._path
+            if not path or not (0 <= page_index < self._page_count):
+                return None
+            data = self._page_cache.get(key)
+            if data is not None:
+                return data
+        
+        document = self._doc()
+        if document is None:
+            return None
+        data = self._render_detached(document, page_index, zoom, rotation)
+        
+        with self._render_lock:
+            if self._path == path:
+                self._page_cache[key] = data
+                while len(self._page_cache) > self._cache_max:
+                    self._page_cache.popitem(last=False)
+        return data
+    
+    def _render_detached(self, document: "fitz.Document", page_index: int,
+                         zoom: float, rotation: int) -> bytes:
+        """
+        Render a page from a worker thread's document handle as PPM bytes.
+        
+        The page is replayed from its shared display list into the thread's
+        own scratch pixmap, so the render itself runs outside
+        ``_render_lock``.
+        """
+        display_list = self._get_display_list(document, page_index)
+        matrix = _render_matrix(zoom, rotation)
+        pix = self._thread_scratch_pixmap((display_list.rect * matrix).irect)
+        return _render_display_list(display_list, matrix, pix)
+    
+    def _thread_scratch_pixmap(self, irect: "fitz.IRect") -> "fitz.Pixmap":
+        """
+        Get an RGB pixmap covering irect for the calling worker thread.
+        
+        Each thread keeps the pixmap of its last render and reuses it when
+        the next one has the same size, as is usual for neighbouring pages
+        and always for interior tiles. to_ppm() copies the samples out, so
+        the buffer is free again once a render returns.
+        """
+        size = (irect.width, irect.height)
+        cached = getattr(self._tls, "scratch_pix", None)
+        if cached is None or cached[0] != size:
+            import fitz
             
-            # Convert to ImageTk
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            img_tk = ImageTk.PhotoImage(img)
+            cached = (size, fitz.Pixmap(fitz.csRGB, irect, False))
+            self._tls.scratch_pix = cached
+        else:
+            cached[1].set_origin(irect.x0, irect.y0)
+        return cached[1]
+    
+    def get_render_size(self, page_index: int, zoom: float, rotation: int) -> Tuple[int, int]:
+        """
+        Get the size in pixels a page renders to, without rasterizing it.
+        
+        Returns:
+            Tuple[int, int]: (width, height) or (0, 0) if the page does not exist
+        """
+        if not self.document or not (0 <= page_index < self._page_count):
+            return (0, 0)
+        
+        rect = self._page_rect(page_index)
+        matrix = _render_matrix(zoom, rotation)
+        irect = (rect * matrix).irect
+        return (irect.width, irect.height)
+    
+    def is_tiled(self, page_index: int, zoom: float, rotation: int) -> bool:
+        """
+        Check whether a page should be rendered as viewport tiles.
+        
+        Rasterized bytes grow with the square of the zoom, so pages much
+        larger than the canvas only have their visible tiles rendered.
+        """
+        width, height = self.get_render_size(page_index, zoom, rotation)
+        canvas_area = max(1, self.canvas_size[0] * self.canvas_size[1])
+        return width * height > _TILED_MIN_CANVAS_AREAS * canvas_area
+    
+    def visible_tiles(self, page_index: int, zoom: float, rotation: int,
+                      viewport: Tuple[float, float, float, float]) -> List[Tuple[int, int]]:
+        """
+        Get the tiles of a page covering a viewport, plus a one-tile margin.
+        
+        Args:
+            page_index (int): Page index (0-indexed)
+            zoom (float): Zoom factor
+            rotation (int): Rotation in degrees
+            viewport (tuple): (x0, y0, x1, y1) in rendered page pixels
             
-            return img_tk
-        except Exception as e:
-            print(f"Error rendering page: {e}")
+        Returns:
+            List[Tuple[int, int]]: (column, row) of each tile
+        """
+        width, height = self.get_render_size(page_index, zoom, rotation)
+        if not width or not height:
+            return []
+        
+        x0, y0, x1, y1 = viewport
+        first_col = max(0, int(x0 // TILE_SIZE) - 1)
+        first_row = max(0, int(y0 // TILE_SIZE) - 1)
+        last_col = min((width - 1) // TILE_SIZE, int(x1 // TILE_SIZE) + 1)
+        last_row = min((height - 1) // TILE_SIZE, int(y1 // TILE_SIZE) + 1)
+        return [(col, row)
+                for row in range(first_row, last_row + 1)
+                for col in range(first_col, last_col + 1)]
+    
+    def submit_tile(self, page_index: int, zoom: float, rotation: int,
+                    col: int, row: int) -> Optional[Future]:
+        """
+        Render one tile of a page as PPM image data on a worker thread.
+        
+        Tile (col, row) covers pixels [col * TILE_SIZE, (col + 1) * TILE_SIZE)
+        horizontally and likewise vertically, clipped to the page.
+        
+        Returns:
+            Future resolving to bytes, or None if the page does not exist
+        """
+        if not self.document or not (0 <= page_index < self._page_count):
             return None
+        
+        key = (page_index, round(zoom, 3), rotation, col, row)
+        with self._render_lock:
+            data = self._tile_cache.get(key)
+            if data is not None:
+                self._tile_cache.move_to_end(key)
+        if data is not None:
+            future = Future()
+            future.set_result(data)
+            return future
+        
+        return self._submit(self._render_tile_cached, page_index, zoom, rotation, col, row)
+    
+    def _render_tile_cached(self, page_index: int, zoom: float, rotation: int,
+                            col: int, row: int) -> Optional[bytes]:
+        """Worker-thread body for submit_tile()."""
+        import fitz
+        
+        key = (page_index, round(zoom, 3), rotation, col, row)
+        with self._render_lock:
+            path = self._path
+            if not path or not (0 <= page_index < self._page_count):
+                return None
+            data = self._tile_cache.get(key)
+            if data is not None:
+                return data
+        
+        document = self._doc()
+        if document is None:
+            return None
+        display_list = self._get_display_list(document, page_index)
+        
+        # Render straight into a pixmap covering just the tile, clipped to it
+        matrix = _render_matrix(zoom, rotation)
+        page_irect = (display_list.rect * matrix).irect
+        x0 = page_irect.x0 + col * TILE_SIZE
+        y0 = page_irect.y0 + row * TILE_SIZE
+        tile = fitz.IRect(x0, y0,
+                          min(x0 + TILE_SIZE, page_irect.x1),
+                          min(y0 + TILE_SIZE, page_irect.y1))
+        pix = self._thread_scratch_pixmap(tile)
+        data = _render_display_list(display_list, matrix, pix)
+        
+        with self._render_lock:
+            if self._path == path:
+                self._tile_cache[key] = data
+                while len(self._tile_cache) > self._tile_max:
+                    self._tile_cache.popitem(last=False)
+        return data
+    
+    def _get_display_list(self, document: "fitz.Document", page_index: int) -> "fitz.DisplayList":
+        """
+        Get the display list of a page, recording it on first use.
+        
+        Display lists are independent of zoom and rotation, and a recorded
+        list can be replayed from any worker thread. Sharing them means a
+        page is interpreted once, whichever workers render its views and
+        tiles. The list is recorded on the calling thread's document
+        handle, outside ``_render_lock``.
+        """
+        key = (page_index, self.render_annotations)
+        with self._render_lock:
+            display_list = self._dl_cache.get(key)
+            if display_list is not None:
+                self._dl_cache.move_to_end(key)
+                return display_list
+            path = self._path
+        
+        page = document.load_page(page_index)
+        display_list = page.get_displaylist(annots=key[1])
+        with self._render_lock:
+            if self._path == path:
+                self._dl_cache[key] = display_list
+                while len(self._dl_cache) > self._dl_max:
+                    self._dl_cache.popitem(last=False)
+        return display_list
     
     def get_page_size(self) -> Tuple[int, int]:
         """
@@ -213,39 +823,31 @@ class PDFHandler:
         Returns:
             Tuple[int, int]: (width, height) or (0, 0) if no document
         """
-        if not self.document or not (0 <= self.current_page < len(self.document)):
+        if not self.document or not (0 <= self.current_page < self._page_count):
             return (0, 0)
         
         try:
-            page = self.document.load_page(self.current_page)
+            rect = self._page_rect(self.current_page)
             
-            # Apply rotation
-            if self.rotation != 0:
-                rotation_matrix = fitz.Matrix(1, 0, 0, 1, 0, 0)
-                rotation_matrix = rotation_matrix.prerotate(self.rotation)
+            # Computed from the page rectangle; no need to rasterize
+            if self.rotation in (90, 270):
+                width, height = rect.height, rect.width
             else:
-                rotation_matrix = fitz.Matrix(1, 0, 0, 1, 0, 0)
-            
-            # Apply zoom
-            zoom_matrix = fitz.Matrix(self.zoom_factor, self.zoom_factor)
-            final_matrix = rotation_matrix * zoom_matrix
-            
-            pix = page.get_pixmap(matrix=final_matrix, alpha=False)
-            return (pix.width, pix.height)
+                width, height = rect.width, rect.height
+            return (int(width * self.zoom_factor), int(height * self.zoom_factor))
         except Exception:
             return (0, 0)
     
     def get_page_info(self) -> dict:
         """Get information about the current page."""
-        if not self.document or not (0 <= self.current_page < len(self.document)):
+        if not self.document or not (0 <= self.current_page < self._page_count):
             return {}
         
         try:
-            page = self.document.load_page(self.current_page)
-            rect = page.rect
+            rect = self._page_rect(self.current_page)
             return {
                 'page_number': self.current_page + 1,
-                'total_pages': len(self.document),
+                'total_pages': self._page_count,
                 'width': rect.width,
                 'height': rect.height,
                 'rotation': self.rotation,
@@ -255,6 +857,86 @@ class PDFHandler:
         except Exception:
             return {}
     
+    def _get_page_text(self, page_index: int) -> str:
+        """
+        Get the text of a page, extracting it on first use.
+        
+        Whitespace is collapsed so queries can match across line breaks.
+        Callers must hold ``_render_lock``.
+        """
+        text = self._text_cache.get(page_index)
+        if text is None:
+            text = _extract_text(self._get_page(page_index))
+            self._store_page_text(page_index, text)
+        return text
+    
+    def _store_page_text(self, page_index: int, text: str):
+        """Add extracted page text to the search caches. Callers must hold ``_render_lock``."""
+        self._text_cache[page_index] = text
+        self._trigram_cache[page_index] = _trigrams(text)
+    
+    def build_text_index(self, max_workers: Optional[int] = None,
+                         cancel: Optional[threading.Event] = None):
+        """
+        Extract the text of every not yet cached page using worker processes.
+        
+        Text extraction is independent per page, so large documents are
+        split across one process per CPU core. Small remainders are left to
+        the lazy per-page extraction. Stops without waiting for the workers
+        when the document changes, background work is cancelled or cancel
+        is set.
+        
+        Args:
+            max_workers (int): Number of worker processes (default: CPU count)
+            cancel (threading.Event): Stops indexing when set
+        """
+        with self._render_lock:
+            file_path = self._path
+            missing = [i for i in range(self._page_count) if i not in self._text_cache]
+        if not file_path or len(missing) < _PARALLEL_INDEX_MIN_PAGES:
+            return
+        
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(missing)))
+        chunk_size = math.ceil(len(missing) / workers)
+        chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+        
+        pool = None
+        try:
+            # Spawn rather than fork: the parent holds Tk and a MuPDF worker thread
+            context = multiprocessing.get_context("spawn")
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            pending = {pool.submit(_extract_page_texts, file_path, chunk) for chunk in chunks}
+            while pending:
+                # Wake up regularly, so closing the document or cancelling
+                # the search never waits for the chunks still being extracted
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                if self._workers_cancelled.is_set() or (cancel is not None and cancel.is_set()):
+                    return
+                with self._render_lock:
+                    if self._path != file_path:
+                        return
+                    for future in done:
+                        for page_index, text in future.result():
+                            self._store_page_text(page_index, text)
+        except Exception as e:
+            # Pages that were not indexed are still extracted lazily
+            print(f"Error building text index: {e}")
+        finally:
+            if pool is not None:
+                # Abandon unfinished chunks instead of blocking on them
+                pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _page_may_contain(self, page_index: int, query_trigrams: frozenset) -> bool:
+        """
+        Quickly rule out pages that cannot contain a query.
+        
+        A subset test against the page's trigram set costs a handful of
+        hash lookups instead of a scan of the page text. Callers must hold
+        ``_render_lock``.
+        """
+        self._get_page_text(page_index)
+        return query_trigrams <= self._trigram_cache[page_index]
+    
     def search_text(self, text: str, case_sensitive: bool = False) -> List[dict]:
         """
         Search for text in the current page.
@@ -269,26 +951,139 @@ class PDFHandler:
         if not self.document or not text:
             return []
         
+        import fitz
+        
         try:
-            page = self.document.load_page(self.current_page)
+            pattern = _compile_query(text)
             flags = 0 if case_sensitive else fitz.TEXT_DEHYPHENATE
-            
-            text_instances = page.search_for(text, flags=flags)
-            results = []
-            
-            for i, rect in enumerate(text_instances):
-                results.append({
+            with self._render_lock:
+                # Rule the page out against its cached text before asking
+                # MuPDF to locate the hits. That text is dehyphenated, so it
+                # can only rule out searches made with the same flags
+                if flags == fitz.TEXT_DEHYPHENATE and (
+                        not self._page_may_contain(self.current_page, _query_trigrams(text))
+                        or not pattern.search(self._get_page_text(self.current_page))):
+                    return []
+                page = self._get_page(self.current_page)
+                text_instances = page.search_for(text, flags=flags)
+            page_number = self.current_page + 1
+            return [
+                {
                     'text': text,
-                    'page': self.current_page + 1,
-                    'instance': i + 1,
+                    'page': page_number,
+                    'instance': i,
                     'rect': (rect.x0, rect.y0, rect.x1, rect.y1)
-                })
-            
-            return results
+                }
+                for i, rect in enumerate(text_instances, 1)
+            ]
         except Exception as e:
             print(f"Error searching text: {e}")
             return []
     
+    def search_document(self, text: str, case_sensitive: bool = False,
+                        results_queue: Optional[queue.Queue] = None,
+                        cancel: Optional[threading.Event] = None) -> List[dict]:
+        """
+        Search every page of the document for text.
+        
+        Pages the text index already rules out are skipped without being
+        loaded. For the others, one text page is built and used both to
+        extract the page text for the index and to locate the hits. Runs
+        on the calling thread's own document handle, so it can be used
+        from a worker thread.
+        
+        Args:
+            text (str): Text to search for
+            case_sensitive (bool): Whether search is case sensitive
+            results_queue (queue.Queue): If given, each page's results are put
+                on it as soon as they are found, followed by None at the end
+            cancel (threading.Event): Stops the search when set
+            
+        Returns:
+            List[dict]: List of found text instances with positions
+        """
+        import fitz
+        
+        results = []
+        try:
+            with self._render_lock:
+                path = self._path
+                page_count = self._page_count
+            if not path or not text:
+                return results
+            
+            # The index holds dehyphenated text, so it can only rule out
+            # pages for searches made with the same flags
+            flags = 0 if case_sensitive else fitz.TEXT_DEHYPHENATE
+            use_index = flags == fitz.TEXT_DEHYPHENATE
+            if use_index:
+                # Large documents get their text extracted in parallel first
+                self.build_text_index(cancel=cancel)
+            
+            document = self._doc()
+            pattern = _compile_query(text)
+            query_trigrams = _query_trigrams(text)
+            
+            for page_index in range(page_count):
+                if self._workers_cancelled.is_set() or (cancel is not None and cancel.is_set()):
+                    break
+                
+                with self._render_lock:
+                    if self._path != path:
+                        break
+                    page_text = self._text_cache.get(page_index) if use_index else None
+                    if page_text is not None and not (
+                            query_trigrams <= self._trigram_cache[page_index]
+                            and pattern.search(page_text)):
+                        continue
+                
+                page = document.load_page(page_index)
+                textpage = page.get_textpage(flags=flags)
+                if page_text is None:
+                    page_text = " ".join(textpage.extractText().split())
+                    if use_index:
+                        # Same flags as _extract_text(), so it can feed the index
+                        with self._render_lock:
+                            if self._path == path and page_index not in self._text_cache:
+                                self._store_page_text(page_index, page_text)
+                    if not pattern.search(page_text):
+                        continue
+                
+                text_instances = page.search_for(text, textpage=textpage)
+                textpage = None
+                page_results = [
+                    {
+                        'text': text,
+                        'page': page_index + 1,
+                        'instance': i,
+                        'rect': (rect.x0, rect.y0, rect.x1, rect.y1)
+                    }
+                    for i, rect in enumerate(text_instances, 1)
+                ]
+                if page_results:
+                    results.extend(page_results)
+                    if results_queue is not None:
+                        results_queue.put(page_results)
+        except Exception as e:
+            print(f"Error searching document: {e}")
+        finally:
+            if results_queue is not None:
+                results_queue.put(None)
+        return results
+    
+    def submit_search_document(self, text: str, case_sensitive: bool = False,
+                               cancel: Optional[threading.Event] = None) -> queue.Queue:
+        """
+        Search the whole document on a worker thread.
+        
+        Returns:
+            queue.Queue: Receives each page's list of results as it is
+            found, then None when the search has finished
+        """
+        results_queue = queue.Queue()
+        self._submit(self.search_document, text, case_sensitive, results_queue, cancel)
+        return results_queue
+    
     def get_zoom_percentage(self) -> str:
         """Get current zoom as percentage string."""
         return f"{round(self.zoom_factor * 100)}%"
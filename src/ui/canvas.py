@@ -3,20 +3,34 @@ Enhanced canvas component for displaying PDF content with improved scaling and s
 """
 import tkinter as tk
 from tkinter import ttk
-from PIL import ImageTk
 from typing import Optional, Callable
 
 
+# Fraction of the scroll range at either end where wheel scrolling turns the page
+_SCROLL_THRESHOLD = 0.05
+
+# Canvas item options shared by every search highlight rectangle
+_HIGHLIGHT_OPTIONS = {
+    'outline': 'red', 'width': 2, 'fill': 'yellow', 'stipple': 'gray50',
+    'tags': "search_highlight"
+}
+
+
 class PDFCanvas:
     """Enhanced canvas widget for displaying PDF pages with scrollbars and scaling."""
     
     def __init__(self, parent):
         self.parent = parent
-        self.images = []  # Keep references to images to prevent garbage collection
+        self._page_photo: Optional[tk.PhotoImage] = None  # Reused by display_page
+        self._page_item: Optional[int] = None
+        self._tiles: dict = {}  # (col, row) -> (tk.PhotoImage, canvas item)
+        self._tile_origin: tuple = (0, 0)  # Canvas position of a tiled page's top-left
         self.canvas_width = 800
         self.canvas_height = 600
+        self._has_highlights = False
         self.on_size_change: Optional[Callable] = None
         self.on_page_change: Optional[Callable] = None  # Callback for automatic page navigation
+        self.on_view_change: Optional[Callable] = None  # Called when the visible area scrolls or resizes
         
         self._create_canvas_frame()
         self._create_canvas()
@@ -64,17 +78,19 @@ class PDFCanvas:
     def _setup_scrolling(self):
         """Setup canvas scrolling configuration."""
         self.canvas.configure(
-            yscrollcommand=self.v_scroll.set, 
-            xscrollcommand=self.h_scroll.set
+            yscrollcommand=self._on_yscroll, 
+            xscrollcommand=self._on_xscroll
         )
         self.canvas.bind('<Configure>', self._on_canvas_configure)
     
     def _setup_mouse_events(self):
         """Setup mouse wheel scrolling and other events."""
-        # Mouse wheel scrolling
-        self.canvas.bind('<MouseWheel>', self._on_mousewheel)
-        self.canvas.bind('<Button-4>', self._on_mousewheel)  # Linux
-        self.canvas.bind('<Button-5>', self._on_mousewheel)  # Linux
+        # Mouse wheel scrolling; X11 reports the wheel as buttons 4 and 5,
+        # which never fire on Windows or macOS
+        self.canvas.bind('<MouseWheel>', self._on_mousewheel_windows)
+        if self.canvas.tk.call('tk', 'windowingsystem') == 'x11':
+            self.canvas.bind('<Button-4>', self._on_mousewheel_linux)
+            self.canvas.bind('<Button-5>', self._on_mousewheel_linux)
         
         # Horizontal scrolling with Shift+MouseWheel
         self.canvas.bind('<Shift-MouseWheel>', self._on_shift_mousewheel)
@@ -88,6 +104,24 @@ class PDFCanvas:
         
         self.pan_start_x = 0
         self.pan_start_y = 0
+        
+        # Wheel deltas accumulated until the next frame
+        self._pending_wheel = 0
+        self._wheel_scheduled = False
+        self._pending_hwheel = 0
+        self._hwheel_scheduled = False
+    
+    def _on_yscroll(self, first, last):
+        """Update the vertical scrollbar and report the view change."""
+        self.v_scroll.set(first, last)
+        if self.on_view_change:
+            self.on_view_change()
+    
+    def _on_xscroll(self, first, last):
+        """Update the horizontal scrollbar and report the view change."""
+        self.h_scroll.set(first, last)
+        if self.on_view_change:
+            self.on_view_change()
     
     def _on_canvas_configure(self, event):
         """Handle canvas configuration changes."""
@@ -95,50 +129,62 @@ class PDFCanvas:
         self.canvas_width = event.width
         self.canvas_height = event.height
         
-        # Update scroll region
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        
-        # Notify size change
+        # The scroll region follows the page, set when it is shown, so only
+        # the size is reported; the app coalesces the re-render a drag causes
         if self.on_size_change:
-            self.on_size_change(self.canvas_width, self.canvas_height)
+            self.on_size_change(event.width, event.height)
     
-    def _on_mousewheel(self, event):
-        """Handle mouse wheel scrolling with automatic page navigation."""
-        # Determine scroll direction and amount
-        if event.delta:  # Windows
-            delta = -1 * (event.delta / 120)
-        elif event.num == 4:  # Linux scroll up
-            delta = -1
-        elif event.num == 5:  # Linux scroll down
-            delta = 1
-        else:
+    def _on_mousewheel_windows(self, event):
+        """Handle <MouseWheel> events, which carry the scroll amount in delta."""
+        if event.delta:
+            self._queue_wheel(-1 * (event.delta / 120))
+    
+    def _on_mousewheel_linux(self, event):
+        """Handle X11 wheel button events (4 scrolls up, 5 scrolls down)."""
+        self._queue_wheel(-1 if event.num == 4 else 1)
+    
+    def _queue_wheel(self, delta: float):
+        """Queue wheel scrolling with automatic page navigation."""
+        # High-resolution wheels fire far more often than the screen
+        # refreshes; apply the accumulated delta once per frame
+        self._pending_wheel += delta
+        if not self._wheel_scheduled:
+            self._wheel_scheduled = True
+            self.canvas.after(16, self._flush_wheel)
+    
+    def _flush_wheel(self):
+        """Apply the wheel scrolling accumulated since the last frame."""
+        delta = self._pending_wheel
+        self._pending_wheel = 0
+        self._wheel_scheduled = False
+        if not delta:
             return
         
+        canvas = self.canvas
+        
         # Get current scroll position
-        current_y_top, current_y_bottom = self.canvas.yview()
+        current_y_top, current_y_bottom = canvas.yview()
         
         # Check if we're at the boundaries and should change pages
-        scroll_threshold = 0.05  # 5% threshold for page change
-        
         if delta > 0:  # Scrolling down
-            if current_y_bottom >= (1.0 - scroll_threshold):
+            if current_y_bottom >= (1.0 - _SCROLL_THRESHOLD):
                 # At bottom, try to go to next page
                 if self.on_page_change:
                     if self.on_page_change('next'):
                         return  # Page changed, don't scroll
                 # If page didn't change, continue with normal scrolling
         else:  # Scrolling up
-            if current_y_top <= scroll_threshold:
+            if current_y_top <= _SCROLL_THRESHOLD:
                 # At top, try to go to previous page
                 if self.on_page_change:
                     if self.on_page_change('prev'):
                         # When going to previous page, scroll to bottom
-                        self.canvas.after(10, lambda: self.canvas.yview_moveto(1.0))
+                        canvas.after(10, lambda: canvas.yview_moveto(1.0))
                         return  # Page changed
                 # If page didn't change, continue with normal scrolling
         
         # Normal scrolling
-        self.canvas.yview_scroll(int(delta), "units")
+        canvas.yview_scroll(int(delta), "units")
     
     def _on_shift_mousewheel(self, event):
         """Handle horizontal scrolling with Shift+MouseWheel."""
@@ -147,6 +193,17 @@ class PDFCanvas:
         else:
             return
         
+        self._pending_hwheel += delta
+        if not self._hwheel_scheduled:
+            self._hwheel_scheduled = True
+            self.canvas.after(16, self._flush_hwheel)
+    
+    def _flush_hwheel(self):
+        """Apply the horizontal wheel scrolling accumulated since the last frame."""
+        delta = self._pending_hwheel
+        self._pending_hwheel = 0
+        self._hwheel_scheduled = False
+        
         # Scroll horizontally
         self.canvas.xview_scroll(int(delta), "units")
     
@@ -172,54 +229,141 @@ class PDFCanvas:
         self.pan_start_x = event.x
         self.pan_start_y = event.y
     
-    def display_image(self, image: ImageTk.PhotoImage, center: bool = True, from_scroll: bool = False):
+    def display_page(self, data: bytes, center: bool = True, from_scroll: bool = False):
         """
-        Display an image on the canvas.
+        Display rendered page data on the canvas.
+        
+        The Tk photo and its canvas item are kept
+        between pages and only their contents and position change, so Tk
+        reallocates the pixel buffer only when the page size changes.
         
         Args:
-            image (ImageTk.PhotoImage): The image to display
+            data (bytes): PPM image data
             center (bool): Whether to center the image in the canvas
             from_scroll (bool): Whether this is from auto-scroll page change
         """
-        # Clear canvas
-        self.clear()
-        
-        # Keep reference to avoid garbage collection
-        self.images.append(image)
+        # Remove overlays belonging to the previous page
+        self.canvas.delete("search_highlight", "page_transition")
+        self._has_highlights = False
+        self._clear_tiles()
         
-        # Calculate position
-        if center:
-            # Center the image in the canvas
-            img_width = image.width()
-            img_height = image.height()
-            
-            x = max(20, (self.canvas_width - img_width) // 2)
-            y = max(20, (self.canvas_height - img_height) // 2)
+        if self._page_photo is None:
+            self._page_photo = tk.PhotoImage(master=self.canvas, data=data)
         else:
-            x, y = 20, 20
+            self._page_photo.configure(data=data)
         
-        # Display on canvas
-        self.canvas.create_image(x, y, anchor=tk.NW, image=image)
-        
-        # Update scroll region with some padding
-        self.canvas.update_idletasks()
-        bbox = self.canvas.bbox("all")
-        if bbox:
-            padx, pady = 50, 50
-            scroll_region = (
-                bbox[0] - padx, bbox[1] - pady, 
-                bbox[2] + padx, bbox[3] + pady
+        width, height = self._page_photo.width(), self._page_photo.height()
+        x, y = self._size_position(width, height, center)
+        if self._page_item is None:
+            self._page_item = self.canvas.create_image(
+                x, y, anchor=tk.NW, image=self._page_photo
             )
-            self.canvas.configure(scrollregion=scroll_region)
+        else:
+            self.canvas.coords(self._page_item, x, y)
+        self._update_scroll_region(x, y, width, height)
         
         # If this is from auto-scroll, provide visual feedback
         if from_scroll:
             self._show_page_transition_effect()
     
+    def begin_tiled_page(self, width: int, height: int, center: bool = True,
+                         from_scroll: bool = False):
+        """
+        Prepare the canvas for a page displayed as separately rendered tiles.
+        
+        The scroll region is sized for the whole page up front; tiles are
+        then added with show_tile() as they are rendered.
+        
+        Args:
+            width (int): Rendered page width in pixels
+            height (int): Rendered page height in pixels
+            center (bool): Whether to center the page in the canvas
+            from_scroll (bool): Whether this is from auto-scroll page change
+        """
+        self.canvas.delete("search_highlight", "page_transition")
+        self._has_highlights = False
+        self._clear_tiles()
+        if self._page_item is not None:
+            self.canvas.delete(self._page_item)
+            self._page_item = None
+        
+        x, y = self._size_position(width, height, center)
+        self._tile_origin = (x, y)
+        self._update_scroll_region(x, y, width, height)
+        
+        if from_scroll:
+            self._show_page_transition_effect()
+    
+    def get_page_viewport(self) -> tuple:
+        """Get the visible area in tiled page pixels as (x0, y0, x1, y1)."""
+        ox, oy = self._tile_origin
+        x0 = self.canvas.canvasx(0) - ox
+        y0 = self.canvas.canvasy(0) - oy
+        return (x0, y0, x0 + self.canvas_width, y0 + self.canvas_height)
+    
+    def show_tile(self, col: int, row: int, x: int, y: int, data: bytes):
+        """
+        Display one rendered tile of the tiled page.
+        
+        Args:
+            col (int): Tile column
+            row (int): Tile row
+            x (int): Tile left edge in page pixels
+            y (int): Tile top edge in page pixels
+            data (bytes): PPM image data
+        """
+        if (col, row) in self._tiles:
+            return
+        ox, oy = self._tile_origin
+        photo = tk.PhotoImage(master=self.canvas, data=data)
+        item = self.canvas.create_image(ox + x, oy + y, anchor=tk.NW, image=photo,
+                                        tags="page_tile")
+        self.canvas.tag_lower(item)
+        self._tiles[(col, row)] = (photo, item)
+    
+    def prune_tiles(self, keep):
+        """Remove displayed tiles not in keep, freeing their images."""
+        keep = set(keep)
+        for key in [key for key in self._tiles if key not in keep]:
+            _, item = self._tiles.pop(key)
+            self.canvas.delete(item)
+    
+    def _clear_tiles(self):
+        """Remove all tiles of a tiled page."""
+        if self._tiles:
+            self.canvas.delete("page_tile")
+            self._tiles.clear()
+    
+    def _size_position(self, width: int, height: int, center: bool) -> tuple:
+        """Calculate the top-left canvas position for content of a given size."""
+        if center:
+            # Center the image in the canvas
+            x = max(20, (self.canvas_width - width) // 2)
+            y = max(20, (self.canvas_height - height) // 2)
+        else:
+            x, y = 20, 20
+        return x, y
+    
+    def _update_scroll_region(self, x: int, y: int, width: int, height: int):
+        """
+        Update scroll region to the page content with some padding.
+        
+        Computed from the page's known position and size, so Tk does not
+        have to flush pending layout to measure it with bbox().
+        """
+        padx, pady = 50, 50
+        scroll_region = (
+            x - padx, y - pady,
+            x + width + padx, y + height + pady
+        )
+        self.canvas.configure(scrollregion=scroll_region)
+    
     def clear(self):
         """Clear the canvas and remove image references."""
         self.canvas.delete("all")
-        self.images.clear()
+        self._has_highlights = False
+        self._tiles.clear()
+        self._page_item = None
     
     def get_canvas_size(self) -> tuple:
         """Get the current canvas size."""
@@ -267,19 +411,21 @@ class PDFCanvas:
         """Set callback for automatic page navigation."""
         self.on_page_change = callback
     
+    def set_view_change_callback(self, callback: Callable):
+        """Set callback for changes of the visible area."""
+        self.on_view_change = callback
+    
     def highlight_search_results(self, results: list):
         """Highlight search results on the canvas."""
         # Remove previous highlights
-        self.canvas.delete("search_highlight")
+        if self._has_highlights:
+            self.canvas.delete("search_highlight")
         
         # Add new highlights
+        create_rectangle = self.canvas.create_rectangle
         for result in results:
-            x1, y1, x2, y2 = result['rect']
-            self.canvas.create_rectangle(
-                x1, y1, x2, y2,
-                outline='red', width=2, fill='yellow', stipple='gray50',
-                tags="search_highlight"
-            )
+            create_rectangle(*result['rect'], **_HIGHLIGHT_OPTIONS)
+        self._has_highlights = bool(results)
     
     def _show_page_transition_effect(self):
         """Show a subtle visual effect when changing pages automatically."""
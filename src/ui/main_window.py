@@ -2,10 +2,47 @@
 Main window UI components for the PDF viewer application.
 """
 import tkinter as tk
-from tkinter import ttk, simpledialog, messagebox
+from tkinter import ttk
 from typing import Callable, Optional
 
 
+def _noop(*args):
+    """Stand-in for callbacks that are not set."""
+
+
+class UIBatch:
+    """
+    Reentrant batch of UI widget writes.
+    
+    While a ``with batch:`` block is open, the toolbar and status bar
+    setters queue their widget writes; the outermost exit applies them in
+    call order.
+    """
+    
+    def __init__(self):
+        self.depth = 0
+        self.pending: list = []  # (apply, args) of the deferred setter calls
+    
+    def __enter__(self):
+        self.depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.depth -= 1
+        if self.depth == 0:
+            pending, self.pending = self.pending, []
+            for apply, args in pending:
+                apply(*args)
+        return False
+    
+    def defer(self, apply: Callable, *args) -> bool:
+        """Queue a setter call if a batch is open; return whether it was queued."""
+        if self.depth:
+            self.pending.append((apply, args))
+            return True
+        return False
+
+
 class MainWindow:
     """Main application window."""
     
@@ -15,9 +52,17 @@ class MainWindow:
         self.root.geometry(geometry)
         self.root.minsize(600, 400)
         
-        # Callbacks
-        self.on_open_pdf: Optional[Callable] = None
-        self.on_exit: Optional[Callable] = None
+        # Callbacks by action name
+        self._cb: dict = {}
+        
+        # Last size reported, so repeated events of one size are dropped
+        self._last_size: Optional[tuple] = None
+        
+        # Shared by the toolbar and status bar to group their widget writes
+        self._batch = UIBatch()
+        
+        # No menu in this window is torn off; set it once for all of them
+        self.root.option_add('*tearOff', False)
         
         self._create_menu()
         self._setup_window()
@@ -28,29 +73,36 @@ class MainWindow:
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
         
-        # Bind window resize event
-        self.root.bind('<Configure>', self._on_window_resize)
+        # Bind window resize event. Every child widget carries the toplevel
+        # in its bindtags, so child reconfigures are filtered out in Tcl
+        # before they reach Python
+        command = self.root.register(self._on_window_resize)
+        self.root.tk.call(
+            'bind', self.root._w, '<Configure>',
+            'if {"%%W" eq "%s"} {%s %%w %%h}' % (self.root._w, command)
+        )
     
-    def _on_window_resize(self, event):
-        """Handle window resize events."""
-        # Only handle main window resize, not child widget resizes
-        if event.widget == self.root:
-            if hasattr(self, 'on_window_resize') and self.on_window_resize:
-                self.on_window_resize(event.width, event.height)
+    def _on_window_resize(self, width: str, height: str):
+        """Handle main window resize events."""
+        size = (int(width), int(height))
+        if size != self._last_size:
+            # The app coalesces the re-render a drag causes
+            self._last_size = size
+            self._cb.get('window_resize', _noop)(*size)
     
     def _create_menu(self):
         """Create the menu bar."""
         menubar = tk.Menu(self.root)
         
         # File menu
-        filemenu = tk.Menu(menubar, tearoff=0)
+        filemenu = tk.Menu(menubar)
         filemenu.add_command(label="Open...", command=self._handle_open, accelerator="Ctrl+O")
         filemenu.add_separator()
         filemenu.add_command(label="Exit", command=self._handle_exit, accelerator="Ctrl+Q")
         menubar.add_cascade(label="File", menu=filemenu)
         
         # View menu
-        viewmenu = tk.Menu(menubar, tearoff=0)
+        viewmenu = tk.Menu(menubar)
         viewmenu.add_command(label="Zoom In", accelerator="Ctrl++")
         viewmenu.add_command(label="Zoom Out", accelerator="Ctrl+-")
         viewmenu.add_command(label="Actual Size", accelerator="Ctrl+0")
@@ -63,7 +115,7 @@ class MainWindow:
         menubar.add_cascade(label="View", menu=viewmenu)
         
         # Go menu
-        gomenu = tk.Menu(menubar, tearoff=0)
+        gomenu = tk.Menu(menubar)
         gomenu.add_command(label="First Page", accelerator="Ctrl+Home")
         gomenu.add_command(label="Previous Page", accelerator="Page Up")
         gomenu.add_command(label="Next Page", accelerator="Page Down")
@@ -84,27 +136,31 @@ class MainWindow:
     
     def _handle_open(self):
         """Handle open menu item click."""
-        if self.on_open_pdf:
-            self.on_open_pdf()
+        self._cb.get('open_pdf', _noop)()
     
     def _handle_exit(self):
         """Handle exit menu item click."""
-        if self.on_exit:
-            self.on_exit()
-        else:
-            self.root.quit()
+        self._cb.get('exit', self.root.quit)()
+    
+    def set_callback(self, name: str, callback: Callable):
+        """Set the callback for an action: 'open_pdf', 'exit' or 'window_resize'."""
+        self._cb[name] = callback
     
     def set_open_callback(self, callback: Callable):
         """Set callback for open PDF action."""
-        self.on_open_pdf = callback
+        self.set_callback('open_pdf', callback)
     
     def set_exit_callback(self, callback: Callable):
         """Set callback for exit action."""
-        self.on_exit = callback
+        self.set_callback('exit', callback)
     
     def set_window_resize_callback(self, callback: Callable):
         """Set callback for window resize."""
-        self.on_window_resize = callback
+        self.set_callback('window_resize', callback)
+    
+    def batch(self) -> UIBatch:
+        """Get the batch that groups toolbar and status bar updates."""
+        return self._batch
     
     def run(self):
         """Start the main event loop."""
@@ -122,46 +178,85 @@ class MainWindow:
 class Toolbar:
     """Enhanced toolbar with navigation, zoom, and view controls."""
     
-    def __init__(self, parent):
+    # Widgets of the deferred sections, which trigger building them
+    _DEFERRED_WIDGETS = frozenset({
+        'zoom_out_btn', 'zoom_label', 'zoom_in_btn',
+        'fit_width_btn', 'fit_height_btn', 'fit_page_btn', 'actual_size_btn',
+        'rotate_btn', 'search_entry', 'search_btn'
+    })
+    
+    def __init__(self, parent, batch: Optional[UIBatch] = None):
         self.frame = ttk.Frame(parent)
         self.frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=2)
-        
-        # Callbacks
-        self.on_prev_page: Optional[Callable] = None
-        self.on_next_page: Optional[Callable] = None
-        self.on_first_page: Optional[Callable] = None
-        self.on_last_page: Optional[Callable] = None
-        self.on_go_to_page: Optional[Callable] = None
-        self.on_zoom_in: Optional[Callable] = None
-        self.on_zoom_out: Optional[Callable] = None
-        self.on_reset_zoom: Optional[Callable] = None
-        self.on_fit_width: Optional[Callable] = None
-        self.on_fit_height: Optional[Callable] = None
-        self.on_fit_page: Optional[Callable] = None
-        self.on_actual_size: Optional[Callable] = None
-        self.on_rotate: Optional[Callable] = None
-        self.on_search: Optional[Callable] = None
-        
-        self._create_controls()
-    
-    def _create_controls(self):
-        """Create enhanced toolbar controls."""
+        self._batch = batch
+        
+        # Callbacks by action name
+        self._cb: dict = {}
+        
+        # Last applied widget state, to skip redundant Tk calls while paging
+        self._btn_state: dict = {}  # button -> tk.NORMAL or tk.DISABLED
+        self._last_page: Optional[tuple] = None  # (current_page, total_pages) shown
+        self._last_zoom: Optional[str] = None  # zoom text shown
+        
+        # Pending search timer, so repeated triggers run only the last query
+        self._search_after = None
+        
+        self._init_style()
+        
+        # Only the navigation section is needed for the first frame; the
+        # rest is built once the window is up, or when first accessed
+        self._create_nav()
+        self._sections_built = False
+        self.frame.after_idle(self._create_deferred_sections)
+    
+    def __getattr__(self, name: str):
+        # Only called for attributes that are not set (yet)
+        if name in Toolbar._DEFERRED_WIDGETS and not self.__dict__.get('_sections_built', True):
+            self._create_deferred_sections()
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    
+    def _init_style(self):
+        """Configure the shared toolbar button style."""
+        # Styles live in the Tcl interpreter, so each Tk root needs its own;
+        # give the derived style an entry once, so the buttons using it
+        # resolve it directly instead of falling back to TButton
+        style = ttk.Style(self.frame)
+        if not style.configure("Toolbar.TButton", "padding"):
+            style.configure("Toolbar.TButton", padding=2)
+    
+    def _tool_button(self, parent, text: str, command: Callable, **options) -> ttk.Button:
+        """Create a small toolbar button packed to the left."""
+        button = ttk.Button(
+            parent, text=text, command=command,
+            width=3, style="Toolbar.TButton", **options
+        )
+        button.pack(side=tk.LEFT, padx=1)
+        return button
+    
+    def _create_deferred_sections(self):
+        """Create the toolbar sections after navigation, left to right."""
+        if self._sections_built:
+            return
+        self._sections_built = True
+        self._create_zoom()
+        self._create_fit()
+        self._create_tools()
+    
+    def _create_nav(self):
+        """Create the navigation section."""
         # Navigation section
         nav_frame = ttk.LabelFrame(self.frame, text="Navigation", padding=5)
         nav_frame.pack(side=tk.LEFT, padx=(0, 10), pady=2)
         
         # First/Previous buttons
-        self.first_btn = ttk.Button(
-            nav_frame, text="⏮", command=self._handle_first_page,
-            state=tk.DISABLED, width=3, style="Toolbar.TButton"
+        self.first_btn = self._tool_button(
+            nav_frame, "⏮", self._handle_first_page, state=tk.DISABLED
         )
-        self.first_btn.pack(side=tk.LEFT, padx=1)
         
-        self.prev_btn = ttk.Button(
-            nav_frame, text="◀", command=self._handle_prev_page,
-            state=tk.DISABLED, width=3, style="Toolbar.TButton"
+        self.prev_btn = self._tool_button(
+            nav_frame, "◀", self._handle_prev_page, state=tk.DISABLED
         )
-        self.prev_btn.pack(side=tk.LEFT, padx=1)
         
         # Page info and entry
         page_frame = ttk.Frame(nav_frame)
@@ -177,37 +272,29 @@ class Toolbar:
         self.page_total_label.pack(side=tk.LEFT, padx=2)
         
         # Next/Last buttons
-        self.next_btn = ttk.Button(
-            nav_frame, text="▶", command=self._handle_next_page,
-            state=tk.DISABLED, width=3, style="Toolbar.TButton"
+        self.next_btn = self._tool_button(
+            nav_frame, "▶", self._handle_next_page, state=tk.DISABLED
         )
-        self.next_btn.pack(side=tk.LEFT, padx=1)
         
-        self.last_btn = ttk.Button(
-            nav_frame, text="⏭", command=self._handle_last_page,
-            state=tk.DISABLED, width=3, style="Toolbar.TButton"
+        self.last_btn = self._tool_button(
+            nav_frame, "⏭", self._handle_last_page, state=tk.DISABLED
         )
-        self.last_btn.pack(side=tk.LEFT, padx=1)
-        
+    
+    def _create_zoom(self):
+        """Create the zoom section."""
         # Zoom section
         zoom_frame = ttk.LabelFrame(self.frame, text="Zoom", padding=5)
         zoom_frame.pack(side=tk.LEFT, padx=(0, 10), pady=2)
         
-        self.zoom_out_btn = ttk.Button(
-            zoom_frame, text="−", command=self._handle_zoom_out, 
-            width=3, style="Toolbar.TButton"
-        )
-        self.zoom_out_btn.pack(side=tk.LEFT, padx=1)
+        self.zoom_out_btn = self._tool_button(zoom_frame, "−", self._handle_zoom_out)
         
         self.zoom_label = ttk.Label(zoom_frame, text="100%", width=6)
         self.zoom_label.pack(side=tk.LEFT, padx=5)
         
-        self.zoom_in_btn = ttk.Button(
-            zoom_frame, text="+", command=self._handle_zoom_in, 
-            width=3, style="Toolbar.TButton"
-        )
-        self.zoom_in_btn.pack(side=tk.LEFT, padx=1)
-        
+        self.zoom_in_btn = self._tool_button(zoom_frame, "+", self._handle_zoom_in)
+    
+    def _create_fit(self):
+        """Create the fit section."""
         # Fit options
         fit_frame = ttk.LabelFrame(self.frame, text="Fit", padding=5)
         fit_frame.pack(side=tk.LEFT, padx=(0, 10), pady=2)
@@ -231,16 +318,14 @@ class Toolbar:
             fit_frame, text="100%", command=self._handle_actual_size, width=6
         )
         self.actual_size_btn.pack(side=tk.LEFT, padx=1)
-        
+    
+    def _create_tools(self):
+        """Create the tools and search section."""
         # Tools section
         tools_frame = ttk.LabelFrame(self.frame, text="Tools", padding=5)
         tools_frame.pack(side=tk.LEFT, padx=(0, 10), pady=2)
         
-        self.rotate_btn = ttk.Button(
-            tools_frame, text="↻", command=self._handle_rotate, 
-            width=3, style="Toolbar.TButton"
-        )
-        self.rotate_btn.pack(side=tk.LEFT, padx=1)
+        self.rotate_btn = self._tool_button(tools_frame, "↻", self._handle_rotate)
         
         # Search section
         search_frame = ttk.Frame(tools_frame)
@@ -260,166 +345,201 @@ class Toolbar:
     
     def _handle_prev_page(self):
         """Handle previous page button click."""
-        if self.on_prev_page:
-            self.on_prev_page()
+        self._cb.get('prev_page', _noop)()
     
     def _handle_next_page(self):
         """Handle next page button click."""
-        if self.on_next_page:
-            self.on_next_page()
+        self._cb.get('next_page', _noop)()
     
     def _handle_first_page(self):
         """Handle first page button click."""
-        if self.on_first_page:
-            self.on_first_page()
+        self._cb.get('first_page', _noop)()
     
     def _handle_last_page(self):
         """Handle last page button click."""
-        if self.on_last_page:
-            self.on_last_page()
+        self._cb.get('last_page', _noop)()
     
     def _handle_page_entry(self, event=None):
         """Handle page entry field."""
-        try:
-            page_num = int(self.page_entry.get())
-            if self.on_go_to_page:
-                self.on_go_to_page(page_num)
-        except ValueError:
-            pass  # Invalid page number
+        text = self.page_entry.get().strip()
+        if text.isdecimal():  # Ignore invalid page numbers
+            self._cb.get('go_to_page', _noop)(int(text))
     
     def _handle_zoom_in(self):
         """Handle zoom in button click."""
-        if self.on_zoom_in:
-            self.on_zoom_in()
+        self._cb.get('zoom_in', _noop)()
     
     def _handle_zoom_out(self):
         """Handle zoom out button click."""
-        if self.on_zoom_out:
-            self.on_zoom_out()
+        self._cb.get('zoom_out', _noop)()
     
     def _handle_reset_zoom(self):
         """Handle reset zoom button click."""
-        if self.on_reset_zoom:
-            self.on_reset_zoom()
+        self._cb.get('reset_zoom', _noop)()
     
     def _handle_fit_width(self):
         """Handle fit width button click."""
-        if self.on_fit_width:
-            self.on_fit_width()
+        self._cb.get('fit_width', _noop)()
     
     def _handle_fit_height(self):
         """Handle fit height button click."""
-        if self.on_fit_height:
-            self.on_fit_height()
+        self._cb.get('fit_height', _noop)()
     
     def _handle_fit_page(self):
         """Handle fit page button click."""
-        if self.on_fit_page:
-            self.on_fit_page()
+        self._cb.get('fit_page', _noop)()
     
     def _handle_actual_size(self):
         """Handle actual size button click."""
-        if self.on_actual_size:
-            self.on_actual_size()
+        self._cb.get('actual_size', _noop)()
     
     def _handle_rotate(self):
         """Handle rotate button click."""
-        if self.on_rotate:
-            self.on_rotate()
+        self._cb.get('rotate', _noop)()
     
     def _handle_search(self, event=None):
         """Handle search functionality."""
         search_text = self.search_entry.get().strip()
-        if search_text and self.on_search:
-            self.on_search(search_text)
+        if search_text and 'search' in self._cb:
+            if self._search_after:
+                self.frame.after_cancel(self._search_after)
+            self._search_after = self.frame.after(250, self._fire_search, search_text)
+    
+    def _fire_search(self, search_text: str):
+        """Run the search the last trigger asked for."""
+        self._search_after = None
+        self._cb.get('search', _noop)(search_text)
     
     # Callback setters
+    def set_callback(self, name: str, callback: Callable):
+        """Set the callback for a toolbar action, e.g. 'next_page' or 'search'."""
+        self._cb[name] = callback
+    
     def set_prev_page_callback(self, callback: Callable):
         """Set callback for previous page action."""
-        self.on_prev_page = callback
+        self.set_callback('prev_page', callback)
     
     def set_next_page_callback(self, callback: Callable):
         """Set callback for next page action."""
-        self.on_next_page = callback
+        self.set_callback('next_page', callback)
     
     def set_first_page_callback(self, callback: Callable):
         """Set callback for first page action."""
-        self.on_first_page = callback
+        self.set_callback('first_page', callback)
     
     def set_last_page_callback(self, callback: Callable):
         """Set callback for last page action."""
-        self.on_last_page = callback
+        self.set_callback('last_page', callback)
     
     def set_go_to_page_callback(self, callback: Callable):
         """Set callback for go to page action."""
-        self.on_go_to_page = callback
+        self.set_callback('go_to_page', callback)
     
     def set_zoom_in_callback(self, callback: Callable):
         """Set callback for zoom in action."""
-        self.on_zoom_in = callback
+        self.set_callback('zoom_in', callback)
     
     def set_zoom_out_callback(self, callback: Callable):
         """Set callback for zoom out action."""
-        self.on_zoom_out = callback
+        self.set_callback('zoom_out', callback)
     
     def set_reset_zoom_callback(self, callback: Callable):
         """Set callback for reset zoom action."""
-        self.on_reset_zoom = callback
+        self.set_callback('reset_zoom', callback)
     
     def set_fit_width_callback(self, callback: Callable):
         """Set callback for fit width action."""
-        self.on_fit_width = callback
+        self.set_callback('fit_width', callback)
     
     def set_fit_height_callback(self, callback: Callable):
         """Set callback for fit height action."""
-        self.on_fit_height = callback
+        self.set_callback('fit_height', callback)
     
     def set_fit_page_callback(self, callback: Callable):
         """Set callback for fit page action."""
-        self.on_fit_page = callback
+        self.set_callback('fit_page', callback)
     
     def set_actual_size_callback(self, callback: Callable):
         """Set callback for actual size action."""
-        self.on_actual_size = callback
+        self.set_callback('actual_size', callback)
     
     def set_rotate_callback(self, callback: Callable):
         """Set callback for rotate action."""
-        self.on_rotate = callback
+        self.set_callback('rotate', callback)
     
     def set_search_callback(self, callback: Callable):
         """Set callback for search action."""
-        self.on_search = callback
+        self.set_callback('search', callback)
     
     # UI update methods
     def update_page_info(self, current_page: int, total_pages: int):
         """Update page information display."""
-        self.page_total_label.config(text=f"/ {total_pages}")
-        self.page_entry.delete(0, tk.END)
-        self.page_entry.insert(0, str(current_page))
+        if self._batch and self._batch.defer(self._apply_page_info, current_page, total_pages):
+            return
+        self._apply_page_info(current_page, total_pages)
+    
+    def _apply_page_info(self, current_page: int, total_pages: int):
+        """Show the page information."""
+        page = (current_page, total_pages)
+        if page == self._last_page:
+            return
+        self._last_page = page
+        
+        # Entry and label in one Tcl round trip
+        self.frame.tk.eval(
+            f'{self.page_entry} delete 0 end; '
+            f'{self.page_entry} insert 0 {int(current_page)}; '
+            f'{self.page_total_label} configure -text "/ {int(total_pages)}"'
+        )
     
     def update_zoom_info(self, zoom_text: str):
         """Update zoom information display."""
-        self.zoom_label.config(text=zoom_text)
+        if self._batch and self._batch.defer(self._apply_zoom_info, zoom_text):
+            return
+        self._apply_zoom_info(zoom_text)
+    
+    def _apply_zoom_info(self, zoom_text: str):
+        """Show the zoom information."""
+        if zoom_text != self._last_zoom:
+            self.zoom_label.config(text=zoom_text)
+            self._last_zoom = zoom_text
     
     def set_navigation_state(self, can_prev: bool, can_next: bool, 
                            can_first: bool, can_last: bool):
         """Set navigation button states."""
-        prev_state = tk.NORMAL if can_prev else tk.DISABLED
-        next_state = tk.NORMAL if can_next else tk.DISABLED
-        first_state = tk.NORMAL if can_first else tk.DISABLED
-        last_state = tk.NORMAL if can_last else tk.DISABLED
-        
-        self.prev_btn.config(state=prev_state)
-        self.next_btn.config(state=next_state)
-        self.first_btn.config(state=first_state)
-        self.last_btn.config(state=last_state)
+        if self._batch and self._batch.defer(self._apply_navigation_state,
+                                             can_prev, can_next, can_first, can_last):
+            return
+        self._apply_navigation_state(can_prev, can_next, can_first, can_last)
+    
+    def _apply_navigation_state(self, can_prev: bool, can_next: bool,
+                                can_first: bool, can_last: bool):
+        """Apply the navigation button states."""
+        # In the middle of a document these stay enabled page after page;
+        # whatever did change is applied in a single Tcl round trip
+        commands = []
+        for button, enabled in ((self.prev_btn, can_prev), (self.next_btn, can_next),
+                                (self.first_btn, can_first), (self.last_btn, can_last)):
+            state = tk.NORMAL if enabled else tk.DISABLED
+            if self._btn_state.get(button) != state:
+                self._btn_state[button] = state
+                commands.append(f"{button} configure -state {state}")
+        
+        if commands:
+            self.frame.tk.eval("; ".join(commands))
+    
+    def _set_state(self, button: ttk.Button, state: str):
+        """Set a button's state unless it already has it."""
+        if self._btn_state.get(button) != state:
+            button.config(state=state)
+            self._btn_state[button] = state
     
     def set_prev_button_state(self, enabled: bool):
         """Enable/disable previous button."""
         state = tk.NORMAL if enabled else tk.DISABLED
-        self.prev_btn.config(state=state)
+        self._set_state(self.prev_btn, state)
     
     def set_next_button_state(self, enabled: bool):
         """Enable/disable next button."""
         state = tk.NORMAL if enabled else tk.DISABLED
-        self.next_btn.config(state=state)
+        self._set_state(self.next_btn, state)
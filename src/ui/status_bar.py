@@ -3,15 +3,46 @@ Status bar component for displaying application status and document information.
 """
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from src.ui.main_window import UIBatch
 
 
 class StatusBar:
-    """Status bar widget for displaying application status."""
+    """
+    Status bar widget for displaying application status.
+    
+    The update methods only reconfigure labels; Tk redraws them once per
+    event-loop iteration. Callers about to block the event loop should use
+    flush() to get a message on screen first, never update().
+    """
+    
+    # Display names of the PDFHandler fit modes
+    _MODE_DISPLAY = {
+        "width": "Fit Width",
+        "height": "Fit Height", 
+        "page": "Fit Page",
+        "actual": "Actual Size",
+        "custom": "Custom Zoom"
+    }
+    
+    # Label text templates
+    _FILE_FMT = "File: %s"
+    _FILE_SIZE_FMT = "File: %s (%s)"
+    _PAGE_FMT = "Page: %d / %d"
+    _ZOOM_FMT = "Zoom: %s"
+    _MODE_FMT = "Mode: %s"
     
-    def __init__(self, parent):
+    def __init__(self, parent, batch: Optional["UIBatch"] = None):
         self.frame = ttk.Frame(parent, relief=tk.SUNKEN)
         self.frame.pack(side=tk.BOTTOM, fill=tk.X)
+        self._batch = batch
+        self._text_cache: dict = {}  # label -> text last set
+        
+        # Info label updates are applied at most ~30 times a second
+        self._pending: dict = {}  # label -> latest text not yet applied
+        self._flush_id = None
         
         # Create status sections
         self._create_sections()
@@ -97,37 +128,80 @@ class StatusBar:
     def update_document_info(self, filename: str, file_size: str = ""):
         """Update document information."""
         if filename:
-            info_text = f"File: {filename}"
             if file_size:
-                info_text += f" ({file_size})"
+                info_text = self._FILE_SIZE_FMT % (filename, file_size)
+            else:
+                info_text = self._FILE_FMT % filename
         else:
             info_text = "No document loaded"
         
-        self.doc_info_label.config(text=info_text)
+        self._queue_text(self.doc_info_label, info_text)
     
     def update_page_info(self, current_page: int, total_pages: int):
         """Update page information."""
-        self.page_info_label.config(text=f"Page: {current_page} / {total_pages}")
+        self._queue_text(self.page_info_label, self._PAGE_FMT % (current_page, total_pages))
     
     def update_zoom_info(self, zoom_text: str):
         """Update zoom information."""
-        self.zoom_info_label.config(text=f"Zoom: {zoom_text}")
+        self._queue_text(self.zoom_info_label, self._ZOOM_FMT % zoom_text)
     
     def update_view_mode(self, mode: str):
         """Update view mode information."""
-        mode_display = {
-            "width": "Fit Width",
-            "height": "Fit Height", 
-            "page": "Fit Page",
-            "actual": "Actual Size"
-        }.get(mode, mode)
-        
-        self.view_mode_label.config(text=f"Mode: {mode_display}")
+        mode_display = self._MODE_DISPLAY.get(mode, mode)
+        
+        self._queue_text(self.view_mode_label, self._MODE_FMT % mode_display)
     
     def set_status(self, message: str):
         """Set status message."""
-        self.status_label.config(text=message)
+        self._set_text(self.status_label, message)
     
     def clear_status(self):
         """Clear status message."""
-        self.status_label.config(text="Ready")
+        self._set_text(self.status_label, "Ready")
+    
+    def _set_text(self, label: ttk.Label, text: str):
+        """
+        Set a label's text unless it already shows it.
+        
+        The update methods run after every render and page change while
+        their text mostly stays the same; skipping no-op writes saves the
+        Tk call and the label's re-layout.
+        """
+        if self._batch and self._batch.defer(self._set_text, label, text):
+            return
+        if self._text_cache.get(label) != text:
+            label.config(text=text)
+            self._text_cache[label] = text
+    
+    def flush(self):
+        """
+        Redraw pending status changes now.
+        
+        Runs only Tk's idle tasks (geometry and redraw), unlike update(), which
+        would also process queued user events re-entrantly. Inside a UI
+        batch, this happens once the batch is applied.
+        """
+        if self._batch and self._batch.defer(self.flush):
+            return
+        if self._flush_id:
+            self.frame.after_cancel(self._flush_id)
+            self._flush_pending()
+        self.frame.update_idletasks()
+    
+    def _queue_text(self, label: ttk.Label, text: str):
+        """
+        Set a label's text with the next throttled refresh.
+        
+        Scrolling and zooming can update the info labels many times per
+        frame; only the latest text per label is applied, 33 ms later.
+        """
+        self._pending[label] = text
+        if self._flush_id is None:
+            self._flush_id = self.frame.after(33, self._flush_pending)
+    
+    def _flush_pending(self):
+        """Apply the queued label texts."""
+        self._flush_id = None
+        pending, self._pending = self._pending, {}
+        for label, text in pending.items():
+            self._set_text(label, text)
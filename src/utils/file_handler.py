@@ -4,72 +4,112 @@ File handling utilities for the PDF viewer application.
 from tkinter import filedialog
 from typing import Optional
 import os
+import stat
 
 
-class FileHandler:
-    """Handles file operations for the PDF viewer."""
+def open_pdf_dialog() -> Optional[str]:
+    """
+    Open a file dialog to select a PDF file.
     
-    @staticmethod
-    def open_pdf_dialog() -> Optional[str]:
-        """
-        Open a file dialog to select a PDF file.
-        
-        Returns:
-            str or None: Path to selected PDF file, or None if cancelled
-        """
-        file_path = filedialog.askopenfilename(
-            title="Open PDF File",
-            filetypes=[("PDF Files", "*.pdf"), ("All Files", "*.*")]
-        )
-        return file_path if file_path else None
+    Returns:
+        str or None: Path to selected PDF file, or None if cancelled
+    """
+    file_path = filedialog.askopenfilename(
+        title="Open PDF File",
+        filetypes=[("PDF Files", "*.pdf"), ("All Files", "*.*")]
+    )
+    return file_path if file_path else None
+
+
+def validate_and_stat(file_path: str) -> Optional[os.stat_result]:
+    """
+    Check that the file is a valid PDF file and get its status.
     
-    @staticmethod
-    def is_valid_pdf(file_path: str) -> bool:
-        """
-        Check if the file is a valid PDF file.
-        
-        Args:
-            file_path (str): Path to the file to check
-            
-        Returns:
-            bool: True if valid PDF, False otherwise
-        """
-        if not os.path.exists(file_path):
-            return False
-        
-        if not file_path.lower().endswith('.pdf'):
-            return False
+    One stat serves both the existence check and, passed on to
+    get_file_info, the file information.
+    
+    Args:
+        file_path (str): Path to the file to check
         
+    Returns:
+        os.stat_result or None: File status if valid PDF, None otherwise
+    """
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return None
+    
+    # Files too short for the header cannot be PDFs; no need to open them
+    if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size < 4:
+        return None
+    
+    # Lowercase only the 4-character suffix, not the whole path
+    if file_path[-4:].lower() != '.pdf':
+        return None
+    
+    try:
+        # Basic check - read first few bytes to check PDF header; a raw
+        # descriptor avoids setting up a buffered file object for 4 bytes
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
         try:
-            # Basic check - read first few bytes to check PDF header
-            with open(file_path, 'rb') as file:
-                header = file.read(4)
-                return header == b'%PDF'
-        except Exception:
-            return False
+            header = os.read(fd, 4)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+    return file_stat if header == b'%PDF' else None
+
+
+def is_valid_pdf(file_path: str) -> bool:
+    """
+    Check if the file is a valid PDF file.
     
-    @staticmethod
-    def get_file_info(file_path: str) -> dict:
-        """
-        Get basic file information.
+    Args:
+        file_path (str): Path to the file to check
         
-        Args:
-            file_path (str): Path to the file
-            
-        Returns:
-            dict: File information including name, size, and path
-        """
-        if not os.path.exists(file_path):
-            return {}
+    Returns:
+        bool: True if valid PDF, False otherwise
+    """
+    return validate_and_stat(file_path) is not None
+
+
+def get_file_info(file_path: str, file_stat: Optional[os.stat_result] = None) -> dict:
+    """
+    Get basic file information.
+    
+    Args:
+        file_path (str): Path to the file
+        file_stat (os.stat_result): Status from validate_and_stat, to
+            avoid statting the file again
         
+    Returns:
+        dict: File information including name, size, and path
+    """
+    if file_stat is None:
+        # A failed stat already means the file does not exist
         try:
-            stat = os.stat(file_path)
-            return {
-                'name': os.path.basename(file_path),
-                'path': file_path,
-                'size': stat.st_size,
-                'size_mb': round(stat.st_size / (1024 * 1024), 2),
-                'modified': stat.st_mtime
-            }
-        except Exception:
+            file_stat = os.stat(file_path)
+        except OSError:
             return {}
+    
+    return {
+        'name': os.path.basename(file_path),
+        'path': file_path,
+        'size': file_stat.st_size,
+        'size_mb': file_stat.st_size / (1024 * 1024),  # Unrounded; format for display
+        'modified': file_stat.st_mtime
+    }
+
+
+class FileHandler:
+    """
+    Handles file operations for the PDF viewer.
+    
+    Kept for compatibility; the module-level functions are called directly
+    and skip the class attribute and staticmethod lookups.
+    """
+    
+    open_pdf_dialog = staticmethod(open_pdf_dialog)
+    validate_and_stat = staticmethod(validate_and_stat)
+    is_valid_pdf = staticmethod(is_valid_pdf)
+    get_file_info = staticmethod(get_file_info)
@@ -0,0 +1,60 @@
+"""
+Tests for PDFHandler rendering, checked against PyMuPDF's own rasterizer.
+
+Run from the repository root with ``python -m pytest``.
+"""
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from src.core.pdf_handler import PDFHandler, TILE_SIZE, _parse_ppm
+
+
+@pytest.fixture
+def handler(tmp_path):
+    """A handler with a one-page document drawn edge to edge."""
+    path = tmp_path / "sample.pdf"
+    document = fitz.open()
+    page = document.new_page(width=300, height=400)
+    page.draw_rect(fitz.Rect(10, 10, 290, 390), color=(0, 0, 1), fill=(1, 0, 0))
+    page.insert_text((40, 350), "bottom corner text", fontsize=14)
+    document.save(str(path))
+    document.close()
+
+    pdf_handler = PDFHandler()
+    assert pdf_handler.open_document(str(path))
+    yield pdf_handler
+    pdf_handler.close_document()
+
+
+def _reference(handler, zoom, rotation):
+    """Render the page with page.get_pixmap() for comparison."""
+    matrix = fitz.Matrix(zoom, zoom).prerotate(rotation)
+    return handler.document.load_page(0).get_pixmap(matrix=matrix, alpha=False)
+
+
+@pytest.mark.parametrize("rotation", [0, 90])
+def test_page_render_matches_get_pixmap(handler, rotation):
+    expected = _reference(handler, 2.0, rotation)
+
+    samples, width, height = _parse_ppm(handler.submit_render(0, 2.0, rotation).result())
+
+    assert (width, height) == (expected.width, expected.height)
+    assert bytes(samples) == expected.samples
+
+
+@pytest.mark.parametrize("rotation", [0, 90])
+def test_tiles_match_get_pixmap(handler, rotation):
+    expected = _reference(handler, 3.0, rotation)
+    width, height = handler.get_render_size(0, 3.0, rotation)
+    assert (width, height) == (expected.width, expected.height)
+
+    for col in range((width - 1) // TILE_SIZE + 1):
+        for row in range((height - 1) // TILE_SIZE + 1):
+            samples, tile_width, tile_height = _parse_ppm(
+                handler.submit_tile(0, 3.0, rotation, col, row).result()
+            )
+            for y in range(tile_height):
+                start = ((row * TILE_SIZE + y) * width + col * TILE_SIZE) * 3
+                line = expected.samples[start:start + tile_width * 3]
+                assert bytes(samples[y * tile_width * 3:(y + 1) * tile_width * 3]) == line
@@ -0,0 +1,116 @@
+"""
+Tests for PDFHandler text search and its cancellation.
+
+Run from the repository root with ``pytest``.
+"""
+import threading
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from src.core.pdf_handler import PDFHandler, _PARALLEL_INDEX_MIN_PAGES
+
+
+def _open(path) -> PDFHandler:
+    pdf_handler = PDFHandler()
+    assert pdf_handler.open_document(str(path))
+    return pdf_handler
+
+
+@pytest.fixture
+def hyphenated(tmp_path):
+    """A handler with a page whose words are hyphenated across lines."""
+    path = tmp_path / "hyphenated.pdf"
+    document = fitz.open()
+    page = document.new_page(width=300, height=400)
+    page.insert_textbox(fitz.Rect(72, 72, 160, 300),
+                        "This is an exam- ple of text with exam-\nple", fontsize=11)
+    document.save(str(path))
+    document.close()
+
+    pdf_handler = _open(path)
+    yield pdf_handler
+    pdf_handler.close_document()
+
+
+@pytest.fixture
+def large_pdf(tmp_path):
+    """Path of a document big enough to be indexed by worker processes."""
+    path = tmp_path / "large.pdf"
+    document = fitz.open()
+    for i in range(_PARALLEL_INDEX_MIN_PAGES * 2):
+        document.new_page().insert_text((72, 72), f"needle on page {i + 1}")
+    document.save(str(path))
+    document.close()
+    return path
+
+
+def _drain(results_queue) -> list:
+    """Collect a search's results up to the None that ends them."""
+    results = []
+    while True:
+        page_results = results_queue.get(timeout=30)
+        if page_results is None:
+            return results
+        results.extend(page_results)
+
+
+def test_case_sensitive_page_search_ignores_dehyphenated_text(hyphenated):
+    # Caches the page's dehyphenated text, where "exam-" no longer appears
+    assert hyphenated.search_text("example")
+
+    assert len(hyphenated.search_text("exam-", case_sensitive=True)) == 2
+
+
+def test_case_sensitive_document_search_ignores_dehyphenated_text(hyphenated):
+    assert hyphenated.search_document("example")
+
+    assert len(hyphenated.search_document("exam-", case_sensitive=True)) == 2
+
+
+def test_search_document_finds_every_page(large_pdf):
+    pdf_handler = _open(large_pdf)
+    try:
+        results = _drain(pdf_handler.submit_search_document("needle"))
+    finally:
+        pdf_handler.close_document()
+
+    assert [result['page'] for result in results] == list(range(1, _PARALLEL_INDEX_MIN_PAGES * 2 + 1))
+
+
+def test_cancelled_search_stops_indexing(large_pdf):
+    pdf_handler = _open(large_pdf)
+    cancel = threading.Event()
+    cancel.set()
+    try:
+        assert pdf_handler.search_document("needle", cancel=cancel) == []
+        assert not pdf_handler._text_cache
+    finally:
+        pdf_handler.close_document()
+
+
+def test_close_ends_running_search(large_pdf):
+    pdf_handler = _open(large_pdf)
+    results_queue = pdf_handler.submit_search_document("needle", cancel=threading.Event())
+
+    pdf_handler.close_document()
+
+    # The search was stopped or had finished; either way it reported its end
+    _drain(results_queue)
+    assert not pdf_handler._worker_futures
+    assert pdf_handler.search_document("needle") == []
+
+
+def test_open_ends_running_search(large_pdf, hyphenated):
+    pdf_handler = _open(large_pdf)
+    results_queue = pdf_handler.submit_search_document("needle", cancel=threading.Event())
+
+    try:
+        assert pdf_handler.open_document(hyphenated._path)
+        _drain(results_queue)
+        assert not pdf_handler._worker_futures
+        # Nothing of the previous document's index is left behind
+        assert pdf_handler.search_document("needle") == []
+    finally:
+        pdf_handler.close_document()